@@ -3,6 +3,15 @@ from typing import List, Optional
 from enum import Enum
 
 
+NS_PER_SECOND = 1_000_000_000
+
+
+def datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the epoch (time.time_ns() scale)"""
+    # Round through microseconds so the float timestamp stays exact
+    return round(value.timestamp() * 1_000_000) * 1000
+
+
 class NotificationType(Enum):
     EMAIL = "email"
     SMS = "sms"
@@ -10,6 +19,9 @@ class NotificationType(Enum):
 
 
 class Event:
+    __slots__ = ('event_id', 'title', 'description', 'start_time', 'start_ns',
+                 'end_time', 'creator_id', 'created_at', 'updated_at')
+
     def __init__(self, event_id: str, title: str, description: str,
                  start_time: datetime, end_time: datetime, creator_id: str):
         self._validate_inputs(title, description, start_time, end_time)
@@ -18,10 +30,10 @@ class Event:
         self.title = title
         self.description = description
         self.start_time = start_time
+        self.start_ns = datetime_to_ns(start_time)
         self.end_time = end_time
         self.creator_id = creator_id
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.created_at = self.updated_at = datetime.now()
 
     def _validate_inputs(self, title: str, description: str,
                         start_time: datetime, end_time: datetime) -> None:
@@ -61,15 +73,22 @@ class Event:
                 raise ValueError("Event start time must be in the future")
 
             self.start_time = new_start
+            self.start_ns = datetime_to_ns(new_start)
             self.end_time = new_end
 
         self.updated_at = datetime.now()
 
     def is_upcoming(self, minutes_ahead: int = 60) -> bool:
         """Check if event is starting within specified minutes"""
-        from datetime import timedelta
-        check_time = datetime.now() + timedelta(minutes=minutes_ahead)
-        return self.start_time <= check_time and self.start_time > datetime.now()
+        return self.is_upcoming_at(datetime.now(), minutes_ahead)
+
+    def is_upcoming_at(self, now: datetime, minutes_ahead: int = 60) -> bool:
+        """Variant of is_upcoming against a caller-supplied clock reading"""
+        return now < self.start_time <= now + timedelta(minutes=minutes_ahead)
+
+    def is_upcoming_ns(self, now_ns: int, minutes_ahead: int = 60) -> bool:
+        """Integer-timestamp variant of is_upcoming for scans over many events"""
+        return now_ns < self.start_ns <= now_ns + minutes_ahead * 60 * NS_PER_SECOND
 
     def get_duration_minutes(self) -> int:
         """Get event duration in minutes"""
@@ -78,6 +97,9 @@ class Event:
 
 
 class Participant:
+    __slots__ = ('participant_id', 'event_id', 'user_id', 'name', 'email',
+                 'phone', 'joined_at')
+
     def __init__(self, participant_id: str, event_id: str, user_id: str,
                  name: str, email: str, phone: Optional[str] = None):
         self._validate_inputs(name, email, phone)
@@ -125,10 +147,15 @@ class Participant:
 
 
 class Notification:
+    __slots__ = ('notification_id', 'event_id', 'participant_id', 'notification_type',
+                 'message', 'scheduled_time', 'scheduled_ns', 'sent_at', 'is_sent',
+                 'created_at')
+
     def __init__(self, notification_id: str, event_id: str, participant_id: str,
                  notification_type: NotificationType, message: str,
                  scheduled_time: datetime):
-        self._validate_inputs(message, scheduled_time)
+        self._validate_inputs(notification_id, event_id, participant_id,
+                              notification_type, message, scheduled_time)
 
         self.notification_id = notification_id
         self.event_id = event_id
@@ -136,14 +163,30 @@ class Notification:
         self.notification_type = notification_type
         self.message = message
         self.scheduled_time = scheduled_time
+        self.scheduled_ns = datetime_to_ns(scheduled_time)
         self.sent_at: Optional[datetime] = None
         self.is_sent = False
         self.created_at = datetime.now()
 
-    def _validate_inputs(self, message: str, scheduled_time: datetime) -> None:
-        if not message or not message.strip():
+    def _validate_inputs(self, notification_id: str, event_id: str, participant_id: str,
+                         notification_type: NotificationType, message: str,
+                         scheduled_time: datetime) -> None:
+        # Enforced once here so repository writes can trust stored notifications
+        for field_name, value in (("notification_id", notification_id),
+                                  ("event_id", event_id),
+                                  ("participant_id", participant_id)):
+            if not value or not isinstance(value, str):
+                raise ValueError(f"Notification must have a valid {field_name} (non-empty string)")
+
+        if not isinstance(notification_type, NotificationType):
+            raise ValueError("Notification must have a valid notification_type")
+
+        if not message or not isinstance(message, str) or not message.strip():
             raise ValueError("Notification message cannot be empty")
 
+        if not isinstance(scheduled_time, datetime):
+            raise ValueError("Notification must have a valid scheduled_time (datetime object)")
+
         # Allow notifications within the last minute (for immediate/demo purposes)
         if scheduled_time <= datetime.now() - timedelta(minutes=1):
             raise ValueError("Scheduled time cannot be more than 1 minute in the past")
@@ -155,12 +198,17 @@ class Notification:
 
     def is_ready_to_send(self) -> bool:
         """Check if notification is ready to be sent"""
-        return not self.is_sent and datetime.now() >= self.scheduled_time
+        return self.is_ready_to_send_at(datetime.now())
+
+    def is_ready_to_send_at(self, now: datetime) -> bool:
+        """Variant of is_ready_to_send against a caller-supplied clock reading"""
+        return not self.is_sent and now >= self.scheduled_time
 
     def get_time_until_send(self) -> int:
         """Get minutes until notification should be sent"""
-        if self.is_sent or datetime.now() >= self.scheduled_time:
+        now = datetime.now()
+        if self.is_sent or now >= self.scheduled_time:
             return 0
 
-        time_diff = self.scheduled_time - datetime.now()
+        time_diff = self.scheduled_time - now
         return max(0, int(time_diff.total_seconds() / 60))
@@ -36,44 +36,38 @@ Implement minimal viable implementation first and then add more features and fun
 """
 
 from datetime import datetime, timedelta
+import logging
 import time
 import threading
+from entities import NotificationType
 from orchestrator import EventSchedulingSystem
 
 
+# Same shape as managers.REMINDER_CHANNELS, with "starting now" wording for the demo
+_IMMEDIATE_CHANNELS = (
+    ('email', NotificationType.EMAIL, "🚨 URGENT: Event '{title}' is starting NOW!"),
+    ('phone', NotificationType.SMS, "🚨 Event '{title}' starts NOW!"),
+    (None, NotificationType.PUSH, "🚨 Event '{title}' is starting NOW!"),
+)
+
+
 def _create_immediate_notifications(system: EventSchedulingSystem, event_id: str) -> list:
     """Create notifications that are ready to send immediately for demo purposes"""
-    from entities import NotificationType
-
     participants = system.get_event_participants(event_id)
     event = system.get_event(event_id)
     notifications = []
+    scheduled_time = datetime.now() - timedelta(seconds=1)  # 1 second ago - ready to send
 
-    for participant in participants:
-        # Create immediate notifications for each type
-        if participant.email:
-            notification = system.notification_manager._create_notification(
-                event, participant, NotificationType.EMAIL,
-                f"🚨 URGENT: Event '{event.title}' is starting NOW!",
-                datetime.now() - timedelta(seconds=1)  # 1 second ago - ready to send
-            )
-            notifications.append(notification)
-
-        if participant.phone:
-            notification = system.notification_manager._create_notification(
-                event, participant, NotificationType.SMS,
-                f"🚨 Event '{event.title}' starts NOW!",
-                datetime.now() - timedelta(seconds=1)  # 1 second ago - ready to send
-            )
-            notifications.append(notification)
+    messages = [(contact_attr, notification_type, template.format(title=event.title))
+                for contact_attr, notification_type, template in _IMMEDIATE_CHANNELS]
 
-        # Always create push notification
-        notification = system.notification_manager._create_notification(
-            event, participant, NotificationType.PUSH,
-            f"🚨 Event '{event.title}' is starting NOW!",
-            datetime.now() - timedelta(seconds=1)  # 1 second ago - ready to send
-        )
-        notifications.append(notification)
+    for participant in participants:
+        # Create immediate notifications for each channel the participant can receive
+        for contact_attr, notification_type, message in messages:
+            if contact_attr is None or getattr(participant, contact_attr):
+                notifications.append(system.notification_manager._create_notification(
+                    event, participant, notification_type, message, scheduled_time
+                ))
 
     return notifications
 
@@ -333,6 +327,9 @@ def interactive_demo():
 
 
 if __name__ == "__main__":
+    # Show the delivery services' per-send records alongside the demo output
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("Choose demo mode:")
     print("1. Automated comprehensive demo")
     print("2. Interactive demo")
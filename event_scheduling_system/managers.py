@@ -1,33 +1,51 @@
-import uuid
-from typing import List, Optional
+import heapq
+import itertools
+import secrets
+import sys
+from typing import List, Optional, Sequence, Set, Tuple
 from datetime import datetime, timedelta
 import threading
-from entities import Event, Participant, Notification, NotificationType
+import time
+from entities import Event, Participant, Notification, NotificationType, NS_PER_SECOND
 from repositories import (
     EventRepository, ParticipantRepository, NotificationRepository
 )
 
+# Reminder channels as (participant contact attribute, type, message template).
+# A None attribute means the channel is always used. Each message is rendered once
+# per scheduling call and interned, so every notification of a channel shares it.
+REMINDER_CHANNELS = (
+    ('email', NotificationType.EMAIL, "Event '{title}' is starting at {full_start}"),
+    ('phone', NotificationType.SMS, "Event '{title}' starts at {short_start}"),
+    (None, NotificationType.PUSH, "⏰ Event '{title}' is starting soon!"),
+)
+
 
 class EventManager:
     def __init__(self, event_repository: EventRepository):
         self.event_repository = event_repository
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._event_count = 0
+        # Process-local IDs: one random prefix per manager plus a counter
+        self._id_prefix = secrets.token_hex(8)
+        self._id_counter = itertools.count()
 
     def create_event(self, title: str, description: str,
                     start_time: datetime, end_time: datetime,
                     creator_id: str) -> Event:
         """Create a new event and save it to the repository"""
         with self._lock:
-            event_id = str(uuid.uuid4())
+            event_id = f"{self._id_prefix}{next(self._id_counter):016x}"
             event = Event(event_id, title, description, start_time, end_time, creator_id)
             self.event_repository.save_event(event)
+            self._event_count += 1
             return event
 
     def get_event(self, event_id: str) -> Optional[Event]:
         """Retrieve an event by its ID"""
         return self.event_repository.find_event_by_id(event_id)
 
-    def get_all_events(self) -> List[Event]:
+    def get_all_events(self) -> Sequence[Event]:
         """Retrieve all events"""
         return self.event_repository.find_all_events()
 
@@ -56,7 +74,20 @@ class EventManager:
     def delete_event(self, event_id: str) -> bool:
         """Delete an event by ID. Returns True if deleted, False if not found"""
         with self._lock:
-            return self.event_repository.delete_event(event_id)
+            deleted = self.event_repository.delete_event(event_id)
+            if deleted:
+                self._event_count -= 1
+            return deleted
+
+    def reset(self) -> None:
+        """Delete every event and zero the counter"""
+        with self._lock:
+            self.event_repository.delete_all_events()
+            self._event_count = 0
+
+    def get_event_count(self) -> int:
+        """Get the number of stored events"""
+        return self._event_count
 
     def get_event_participants_count(self, event_id: str) -> int:
         """Get the number of participants for an event"""
@@ -68,7 +99,10 @@ class EventManager:
 class ParticipantManager:
     def __init__(self, participant_repository: ParticipantRepository):
         self.participant_repository = participant_repository
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._participant_count = 0
+        self._id_prefix = secrets.token_hex(8)
+        self._id_counter = itertools.count()
 
     def add_participant(self, event_id: str, user_id: str,
                        name: str, email: str,
@@ -82,9 +116,10 @@ class ParticipantManager:
             if existing_participant:
                 raise ValueError(f"User {user_id} is already a participant in event {event_id}")
 
-            participant_id = str(uuid.uuid4())
+            participant_id = f"{self._id_prefix}{next(self._id_counter):016x}"
             participant = Participant(participant_id, event_id, user_id, name, email, phone)
             self.participant_repository.save_participant(participant)
+            self._participant_count += 1
             return participant
 
     def get_participant(self, participant_id: str) -> Optional[Participant]:
@@ -95,7 +130,7 @@ class ParticipantManager:
         """Get all participants for a specific event"""
         return self.participant_repository.find_participants_by_event(event_id)
 
-    def get_all_participants(self) -> List[Participant]:
+    def get_all_participants(self) -> Sequence[Participant]:
         """Retrieve all participants across all events"""
         return self.participant_repository.find_all_participants()
 
@@ -116,12 +151,30 @@ class ParticipantManager:
     def remove_participant(self, participant_id: str) -> bool:
         """Remove a participant from an event. Returns True if removed, False if not found"""
         with self._lock:
-            return self.participant_repository.delete_participant(participant_id)
+            removed = self.participant_repository.delete_participant(participant_id)
+            if removed:
+                self._participant_count -= 1
+            return removed
 
     def remove_all_participants_from_event(self, event_id: str) -> int:
         """Remove all participants from an event. Returns number of participants removed"""
         with self._lock:
-            return self.participant_repository.delete_participants_by_event(event_id)
+            removed_count = self.participant_repository.delete_participants_by_event(event_id)
+            self._participant_count -= removed_count
+            # Dicts never shrink on delete; rebuild once most of the storage is gone
+            if removed_count > self._participant_count:
+                self.participant_repository.compact()
+            return removed_count
+
+    def reset(self) -> None:
+        """Delete every participant and zero the counter"""
+        with self._lock:
+            self.participant_repository.delete_all_participants()
+            self._participant_count = 0
+
+    def get_participant_count(self) -> int:
+        """Get the number of stored participants"""
+        return self._participant_count
 
 
 class NotificationManager:
@@ -131,7 +184,22 @@ class NotificationManager:
         self.notification_repository = notification_repository
         self.event_repository = event_repository
         self.participant_repository = participant_repository
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._notification_count = 0
+        self._sent_count = 0
+        self._id_prefix = secrets.token_hex(8)
+        self._id_counter = itertools.count()
+        # Ping-pong wake-up index: producers append (scheduled_ns, notification_id) to the
+        # staged buffer under _pending_cv; the processor swaps it out and merges it into its
+        # private min-heap outside the lock (only wait_for_next_due touches the heap).
+        # Entries are staged only while a processor is attached, so nothing accumulates
+        # when no one drains the buffer
+        self._processor_attached = False
+        self._staged_pending: List[Tuple[int, str]] = []
+        self._pending_heap: List[Tuple[int, str]] = []
+        self._pending_cv = threading.Condition()
+        # Eventcount: bumped on every wake-up so a waiter can detect signals it missed
+        self._wake_generation = 0
 
     def schedule_event_notifications(self, event_id: str,
                                     minutes_before: int = 60) -> List[Notification]:
@@ -147,47 +215,68 @@ class NotificationManager:
 
             # Calculate notification time
             notification_time = event.start_time - timedelta(minutes=minutes_before)
-
-            notifications = []
-            for participant in participants:
-                # Create notification for each type if contact info is available
-                if participant.email:
-                    email_notification = self._create_notification(
-                        event, participant, NotificationType.EMAIL,
-                        f"Event '{event.title}' is starting at {event.start_time.strftime('%Y-%m-%d %H:%M')}",
-                        notification_time
-                    )
-                    notifications.append(email_notification)
-
-                if participant.phone:
-                    sms_notification = self._create_notification(
-                        event, participant, NotificationType.SMS,
-                        f"Event '{event.title}' starts at {event.start_time.strftime('%H:%M')}",
-                        notification_time
-                    )
-                    notifications.append(sms_notification)
-
-                # Always create push notification
-                push_notification = self._create_notification(
-                    event, participant, NotificationType.PUSH,
-                    f"⏰ Event '{event.title}' is starting soon!",
-                    notification_time
-                )
-                notifications.append(push_notification)
-
+            full_start = event.start_time.strftime('%Y-%m-%d %H:%M')
+            short_start = event.start_time.strftime('%H:%M')
+            channels = [
+                (contact_attr, notification_type, sys.intern(template.format(
+                    title=event.title, full_start=full_start, short_start=short_start
+                )))
+                for contact_attr, notification_type, template in REMINDER_CHANNELS
+            ]
+
+            # Grouped by channel; a channel is skipped when the contact info is missing
+            notifications = [
+                self._make_notification(event, participant, notification_type,
+                                        message, notification_time)
+                for contact_attr, notification_type, message in channels
+                for participant in participants
+                if contact_attr is None or getattr(participant, contact_attr)
+            ]
+
+            self.notification_repository.save_notifications(notifications)
+            self._notification_count += len(notifications)
+            self._track_pending(notifications)
             return notifications
 
     def _create_notification(self, event: Event, participant: Participant,
                             notification_type: NotificationType,
                             message: str, scheduled_time: datetime) -> Notification:
         """Create a notification for a participant"""
-        notification_id = str(uuid.uuid4())
-        notification = Notification(
+        notification = self._make_notification(
+            event, participant, notification_type, message, scheduled_time
+        )
+        with self._lock:
+            self.notification_repository.save_notification(notification)
+            self._notification_count += 1
+        self._track_pending([notification])
+        return notification
+
+    def _make_notification(self, event: Event, participant: Participant,
+                           notification_type: NotificationType,
+                           message: str, scheduled_time: datetime) -> Notification:
+        """Build a notification object without saving it"""
+        notification_id = f"{self._id_prefix}{next(self._id_counter):016x}"
+        return Notification(
             notification_id, event.event_id, participant.participant_id,
             notification_type, message, scheduled_time
         )
-        self.notification_repository.save_notification(notification)
-        return notification
+
+    def _track_pending(self, notifications: List[Notification]) -> None:
+        """Stage saved notifications for the processor's wake-up heap and wake it.
+        A no-op while no processor is attached"""
+        with self._pending_cv:
+            if not self._processor_attached:
+                return
+            was_empty = not self._staged_pending
+            self._staged_pending.extend(
+                (notification.scheduled_ns, notification.notification_id)
+                for notification in notifications
+            )
+            self._wake_generation += 1
+            # Only the empty -> non-empty transition needs a signal; later producers
+            # ride on the wake-up already sent for this buffer
+            if was_empty:
+                self._pending_cv.notify()
 
     def get_notification(self, notification_id: str) -> Optional[Notification]:
         """Retrieve a notification by its ID"""
@@ -205,28 +294,155 @@ class NotificationManager:
         """Get all notifications that are ready to be sent"""
         return self.notification_repository.find_pending_notifications()
 
-    def get_all_notifications(self) -> List[Notification]:
+    def get_pending_notification_count(self) -> int:
+        """Get the number of notifications that are ready to be sent"""
+        return self.notification_repository.count_pending_notifications()
+
+    def get_all_notifications(self) -> Sequence[Notification]:
         """Retrieve all notifications"""
         return self.notification_repository.find_all_notifications()
 
     def mark_notification_sent(self, notification_id: str) -> bool:
         """Mark a notification as sent. Returns True if marked, False if not found"""
         with self._lock:
+            if self._mark_sent_locked([notification_id]):
+                return True
+            # Unknown or already sent; the latter is re-marked, refreshing sent_at
             return self.notification_repository.mark_notification_as_sent(notification_id)
 
+    def mark_notifications_sent(self, notification_ids: List[str]) -> Set[str]:
+        """Mark several unsent notifications as sent in one repository call. Returns the IDs marked"""
+        with self._lock:
+            return self._mark_sent_locked(notification_ids)
+
+    def _mark_sent_locked(self, notification_ids: List[str]) -> Set[str]:
+        """Bulk-mark notifications and update the sent counter. Caller must hold the lock"""
+        marked_ids = self.notification_repository.mark_notifications_sent_bulk(notification_ids)
+        self._sent_count += len(marked_ids)
+        return marked_ids
+
     def delete_notification(self, notification_id: str) -> bool:
         """Delete a notification by ID. Returns True if deleted, False if not found"""
         with self._lock:
-            return self.notification_repository.delete_notification(notification_id)
+            notification = self.notification_repository.find_notification_by_id(notification_id)
+            if not self.notification_repository.delete_notification(notification_id):
+                return False
+            self._account_deleted_locked([notification])
+            return True
+
+    def delete_event_notifications(self, event_id: str) -> int:
+        """Delete all notifications for an event. Returns number of notifications deleted"""
+        with self._lock:
+            deleted = self.notification_repository.delete_notifications_by_event(event_id)
+            self._account_deleted_locked(deleted)
+            return len(deleted)
+
+    def delete_participant_notifications(self, participant_id: str) -> int:
+        """Delete all notifications for a participant. Returns number of notifications deleted"""
+        with self._lock:
+            deleted = self.notification_repository.delete_notifications_by_participant(participant_id)
+            self._account_deleted_locked(deleted)
+            return len(deleted)
+
+    def delete_notifications_sent_before(self, cutoff: datetime) -> int:
+        """Delete notifications sent before the cutoff. Returns number of notifications deleted"""
+        with self._lock:
+            deleted = self.notification_repository.delete_notifications_sent_before(cutoff)
+            self._account_deleted_locked(deleted)
+            return len(deleted)
+
+    def _account_deleted_locked(self, notifications: List[Notification]) -> None:
+        """Update counters after notifications were deleted. Caller must hold the lock"""
+        self._notification_count -= len(notifications)
+        self._sent_count -= sum(1 for notification in notifications if notification.is_sent)
+        # Dicts never shrink on delete; rebuild once most of the storage is gone
+        if len(notifications) > self._notification_count:
+            self.notification_repository.compact()
 
     def process_pending_notifications(self) -> List[Notification]:
         """Process and mark pending notifications as sent. Returns processed notifications"""
         with self._lock:
-            pending_notifications = self.get_pending_notifications()
-            processed_notifications = []
-
-            for notification in pending_notifications:
-                if self.mark_notification_sent(notification.notification_id):
-                    processed_notifications.append(notification)
+            pending_notifications = self.notification_repository.find_pending_notifications()
+            marked_ids = self._mark_sent_locked(
+                [notification.notification_id for notification in pending_notifications]
+            )
+            return [notification for notification in pending_notifications
+                    if notification.notification_id in marked_ids]
 
-            return processed_notifications
+    def reset(self) -> None:
+        """Delete every notification, zero the counters and drop all wake-up entries.
+        The processor must not be running: its private heap is cleared here"""
+        with self._lock:
+            self.notification_repository.delete_all_notifications()
+            self._notification_count = 0
+            self._sent_count = 0
+        with self._pending_cv:
+            self._staged_pending = []
+            self._pending_heap = []
+            self._wake_generation += 1
+
+    def get_notification_count(self) -> int:
+        """Get the number of stored notifications"""
+        return self._notification_count
+
+    def get_sent_notification_count(self) -> int:
+        """Get the number of stored notifications that have been sent"""
+        return self._sent_count
+
+    def attach_processor(self) -> None:
+        """Start staging wake-up entries, seeded with every stored notification not yet due.
+        Call before the processor thread starts"""
+        with self._pending_cv:
+            self._processor_attached = True
+            # Taken under _pending_cv so a notification saved meanwhile is staged at
+            # least once (duplicates are popped once processed)
+            self._staged_pending = self.notification_repository.find_scheduled_unsent_times()
+            self._pending_heap = []
+            self._wake_generation += 1
+
+    def detach_processor(self) -> None:
+        """Stop staging wake-up entries and drop the ones held. Call after the processor stopped"""
+        with self._pending_cv:
+            self._processor_attached = False
+            self._staged_pending = []
+            self._pending_heap = []
+
+    def prepare_wait(self) -> int:
+        """Snapshot the wake-up generation before a processing pass.
+        Pass the result to wait_for_next_due once the pass is done"""
+        return self._wake_generation
+
+    def wait_for_next_due(self, generation: int, processed_until_ns: int, max_wait: float) -> None:
+        """Block until the earliest unprocessed notification is due, a new one is
+        scheduled, wake_processor() is called, or max_wait seconds elapse.
+        Returns immediately if any of those wake-ups happened since prepare_wait()"""
+        with self._pending_cv:
+            if self._wake_generation != generation:
+                return
+            staged, self._staged_pending = self._staged_pending, []
+
+        heap = self._pending_heap
+        if len(staged) > len(heap):
+            heap.extend(staged)
+            heapq.heapify(heap)
+        else:
+            for entry in staged:
+                heapq.heappush(heap, entry)
+        # Entries due at or before processed_until_ns were handled by the last pass
+        while heap and heap[0][0] <= processed_until_ns:
+            heapq.heappop(heap)
+
+        timeout = max_wait
+        if heap:
+            timeout = min(timeout, (heap[0][0] - time.time_ns()) / NS_PER_SECOND)
+        if timeout > 0:
+            with self._pending_cv:
+                # Anything staged while merging bumped the generation; don't sleep through it
+                if self._wake_generation == generation:
+                    self._pending_cv.wait(timeout)
+
+    def wake_processor(self) -> None:
+        """Wake any thread blocked in wait_for_next_due"""
+        with self._pending_cv:
+            self._wake_generation += 1
+            self._pending_cv.notify_all()
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime, timedelta
 import threading
 import time
@@ -36,7 +36,7 @@ class EventSchedulingSystem:
         # Background notification processor
         self._notification_processor_thread: Optional[threading.Thread] = None
         self._stop_processing = threading.Event()
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
 
     # Event Management Methods
     def create_event(self, title: str, description: str,
@@ -49,7 +49,7 @@ class EventSchedulingSystem:
         """Get an event by ID"""
         return self.event_manager.get_event(event_id)
 
-    def get_all_events(self) -> List[Event]:
+    def get_all_events(self) -> Sequence[Event]:
         """Get all events"""
         return self.event_manager.get_all_events()
 
@@ -67,9 +67,7 @@ class EventSchedulingSystem:
             self.participant_manager.remove_all_participants_from_event(event_id)
 
             # Remove all notifications
-            event_notifications = self.notification_manager.get_event_notifications(event_id)
-            for notification in event_notifications:
-                self.notification_manager.delete_notification(notification.notification_id)
+            self.notification_manager.delete_event_notifications(event_id)
 
             # Delete the event
             return self.event_manager.delete_event(event_id)
@@ -89,9 +87,7 @@ class EventSchedulingSystem:
         """Remove a participant from an event"""
         with self._lock:
             # Remove all notifications for this participant first
-            participant_notifications = self.notification_manager.get_participant_notifications(participant_id)
-            for notification in participant_notifications:
-                self.notification_manager.delete_notification(notification.notification_id)
+            self.notification_manager.delete_participant_notifications(participant_id)
 
             # Remove the participant
             return self.participant_manager.remove_participant(participant_id)
@@ -116,14 +112,17 @@ class EventSchedulingSystem:
         if not pending_notifications:
             return []
 
-        sent_notifications = []
+        # The dispatcher overlaps the sends on its delivery pool
+        results = self.notification_dispatcher.send_bulk_notifications(pending_notifications)
+        sent_notifications = [notification for notification in pending_notifications
+                              if results[notification.notification_id]]
 
-        for notification in pending_notifications:
-            if self.notification_dispatcher.send_notification(notification):
-                self.notification_manager.mark_notification_sent(notification.notification_id)
-                sent_notifications.append(notification)
-
-        return sent_notifications
+        # Flip all delivered notifications to sent under a single lock acquisition
+        marked_ids = self.notification_manager.mark_notifications_sent(
+            [notification.notification_id for notification in sent_notifications]
+        )
+        return [notification for notification in sent_notifications
+                if notification.notification_id in marked_ids]
 
     def get_event_notifications(self, event_id: str) -> List[Notification]:
         """Get all notifications for an event"""
@@ -142,6 +141,7 @@ class EventSchedulingSystem:
                 return
 
             self._stop_processing.clear()
+            self.notification_manager.attach_processor()
             self._notification_processor_thread = threading.Thread(
                 target=self._notification_processor_loop,
                 args=(check_interval_seconds,),
@@ -158,19 +158,31 @@ class EventSchedulingSystem:
                 return
 
             self._stop_processing.set()
+            self.notification_manager.wake_processor()
             self._notification_processor_thread.join(timeout=5.0)
+            self.notification_manager.detach_processor()
             print("🔔 Stopped background notification processor")
 
     def _notification_processor_loop(self, check_interval_seconds: int) -> None:
-        """Background loop to process pending notifications"""
+        """Background loop to process pending notifications.
+
+        Sleeps until the next notification is due (or a new one is scheduled);
+        check_interval_seconds only caps the wait so failed sends are retried.
+        """
         while not self._stop_processing.is_set():
             try:
+                # Taken before the pass so work scheduled during it is never slept through
+                generation = self.notification_manager.prepare_wait()
+                processed_until_ns = time.time_ns()
                 sent_notifications = self.send_pending_notifications()
                 if sent_notifications:
                     print(f"📤 Processed {len(sent_notifications)} notifications")
 
-                # Wait before next check
-                self._stop_processing.wait(check_interval_seconds)
+                if self._stop_processing.is_set():
+                    break
+                self.notification_manager.wait_for_next_due(
+                    generation, processed_until_ns, check_interval_seconds
+                )
 
             except Exception as e:
                 print(f"❌ Error in notification processor: {e}")
@@ -183,28 +195,31 @@ class EventSchedulingSystem:
 
     def get_system_stats(self) -> dict:
         """Get system statistics"""
+        # Read-only: the counters are maintained by the managers under their own locks
+        processor_thread = self._notification_processor_thread
+        return {
+            "total_events": self.event_manager.get_event_count(),
+            "total_participants": self.participant_manager.get_participant_count(),
+            "total_notifications": self.notification_manager.get_notification_count(),
+            "sent_notifications": self.notification_manager.get_sent_notification_count(),
+            "pending_notifications": self.notification_manager.get_pending_notification_count(),
+            "notification_processor_running": (
+                processor_thread is not None and processor_thread.is_alive()
+            )
+        }
+
+    def reset(self) -> None:
+        """Stop the processor and delete all events, participants and notifications in one
+        step per store, keeping the dispatcher and its services (e.g. between tests)"""
+        processor_thread = self._notification_processor_thread
+        if processor_thread is not None and processor_thread.is_alive():
+            self.stop_notification_processor()
         with self._lock:
-            return {
-                "total_events": len(self.event_manager.get_all_events()),
-                "total_participants": len(self.participant_manager.get_all_participants()),
-                "total_notifications": len(self.notification_manager.get_all_notifications()),
-                "pending_notifications": len(self.notification_manager.get_pending_notifications()),
-                "notification_processor_running": (
-                    self._notification_processor_thread is not None and
-                    self._notification_processor_thread.is_alive()
-                )
-            }
+            self.notification_manager.reset()
+            self.participant_manager.reset()
+            self.event_manager.reset()
 
     def cleanup_old_notifications(self, days_old: int = 30) -> int:
         """Clean up old notifications. Returns number of notifications deleted"""
-        with self._lock:
-            cutoff_date = datetime.now() - timedelta(days=days_old)
-            all_notifications = self.notification_manager.get_all_notifications()
-
-            deleted_count = 0
-            for notification in all_notifications:
-                if notification.sent_at and notification.sent_at < cutoff_date:
-                    if self.notification_manager.delete_notification(notification.notification_id):
-                        deleted_count += 1
-
-            return deleted_count
+        cutoff_date = datetime.now() - timedelta(days=days_old)
+        return self.notification_manager.delete_notifications_sent_before(cutoff_date)
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import DefaultDict, List, Optional, Dict, Sequence, Set, Tuple
+from collections import defaultdict
 from datetime import datetime
+import heapq
 import threading
+import time
 from entities import Event, Participant, Notification, NotificationType
 
 
@@ -17,7 +20,7 @@ class EventRepository(ABC):
         pass
 
     @abstractmethod
-    def find_all_events(self) -> List[Event]:
+    def find_all_events(self) -> Sequence[Event]:
         """Retrieve all events"""
         pass
 
@@ -41,6 +44,15 @@ class EventRepository(ABC):
         """Delete an event by ID. Returns True if deleted, False if not found"""
         pass
 
+    @abstractmethod
+    def delete_all_events(self) -> None:
+        """Delete every stored event"""
+        pass
+
+    def compact(self) -> None:
+        """Release memory left behind by bulk deletes. A no-op unless overridden"""
+        pass
+
 
 class ParticipantRepository(ABC):
     @abstractmethod
@@ -64,7 +76,7 @@ class ParticipantRepository(ABC):
         pass
 
     @abstractmethod
-    def find_all_participants(self) -> List[Participant]:
+    def find_all_participants(self) -> Sequence[Participant]:
         """Retrieve all participants"""
         pass
 
@@ -83,6 +95,15 @@ class ParticipantRepository(ABC):
         """Delete all participants for an event. Returns number of participants deleted"""
         pass
 
+    @abstractmethod
+    def delete_all_participants(self) -> None:
+        """Delete every stored participant"""
+        pass
+
+    def compact(self) -> None:
+        """Release memory left behind by bulk deletes. A no-op unless overridden"""
+        pass
+
 
 class NotificationRepository(ABC):
     @abstractmethod
@@ -90,6 +111,11 @@ class NotificationRepository(ABC):
         """Save a new notification to the repository"""
         pass
 
+    @abstractmethod
+    def save_notifications(self, notifications: List[Notification]) -> None:
+        """Save several new notifications to the repository in one call"""
+        pass
+
     @abstractmethod
     def find_notification_by_id(self, notification_id: str) -> Optional[Notification]:
         """Find a notification by its ID"""
@@ -111,7 +137,17 @@ class NotificationRepository(ABC):
         pass
 
     @abstractmethod
-    def find_all_notifications(self) -> List[Notification]:
+    def count_pending_notifications(self) -> int:
+        """Count notifications that are ready to be sent but not yet sent"""
+        pass
+
+    @abstractmethod
+    def find_scheduled_unsent_times(self) -> List[Tuple[int, str]]:
+        """Find (scheduled_ns, notification_id) for every unsent notification not yet due"""
+        pass
+
+    @abstractmethod
+    def find_all_notifications(self) -> Sequence[Notification]:
         """Retrieve all notifications"""
         pass
 
@@ -120,50 +156,118 @@ class NotificationRepository(ABC):
         """Update an existing notification"""
         pass
 
+    def update_notification_strict(self, notification: Notification) -> None:
+        """Validate an untrusted notification object field by field, then update it.
+        update_notification relies on the invariants Notification enforces on construction"""
+        if not isinstance(notification, Notification):
+            raise TypeError("Provided object is not a Notification instance")
+        if not notification.notification_id or not isinstance(notification.notification_id, str):
+            raise ValueError("Notification must have a valid notification_id (non-empty string)")
+        if not notification.event_id or not isinstance(notification.event_id, str):
+            raise ValueError("Notification must have a valid event_id (non-empty string)")
+        if not notification.participant_id or not isinstance(notification.participant_id, str):
+            raise ValueError("Notification must have a valid participant_id (non-empty string)")
+        if not notification.message or not isinstance(notification.message, str):
+            raise ValueError("Notification must have a valid message (non-empty string)")
+        if notification.scheduled_time is None or not isinstance(notification.scheduled_time, datetime):
+            raise ValueError("Notification must have a valid scheduled_time (datetime object)")
+        if notification.notification_type is None:
+            raise ValueError("Notification must have a valid notification_type")
+        self.update_notification(notification)
+
     @abstractmethod
     def delete_notification(self, notification_id: str) -> bool:
         """Delete a notification by ID. Returns True if deleted, False if not found"""
         pass
 
+    @abstractmethod
+    def delete_notifications_by_event(self, event_id: str) -> List[Notification]:
+        """Delete all notifications for an event. Returns the deleted notifications"""
+        pass
+
+    @abstractmethod
+    def delete_notifications_by_participant(self, participant_id: str) -> List[Notification]:
+        """Delete all notifications for a participant. Returns the deleted notifications"""
+        pass
+
+    @abstractmethod
+    def delete_notifications_sent_before(self, cutoff: datetime) -> List[Notification]:
+        """Delete notifications sent before the cutoff. Returns the deleted notifications"""
+        pass
+
     @abstractmethod
     def mark_notification_as_sent(self, notification_id: str) -> bool:
         """Mark a notification as sent. Returns True if updated, False if not found"""
         pass
 
+    @abstractmethod
+    def mark_notifications_sent_bulk(self, notification_ids: List[str]) -> Set[str]:
+        """Mark several unsent notifications as sent. Returns the IDs that were marked"""
+        pass
+
+    @abstractmethod
+    def delete_all_notifications(self) -> None:
+        """Delete every stored notification"""
+        pass
+
+    def compact(self) -> None:
+        """Release memory left behind by bulk deletes. A no-op unless overridden"""
+        pass
+
+
+def _discard_from_index(index: Dict[str, Dict[str, None]], key: str, entity_id: str) -> None:
+    """Drop an ID from a secondary index, removing the bucket once it is empty"""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(entity_id, None)
+        if not bucket:
+            del index[key]
+
+
+def _rebuild_index(index: DefaultDict[str, Dict[str, None]]) -> DefaultDict[str, Dict[str, None]]:
+    """Copy a secondary index into right-sized tables (dicts never shrink in place)"""
+    return defaultdict(dict, {key: dict(bucket) for key, bucket in index.items()})
+
 
 class InMemoryEventRepository(EventRepository):
+    """Writers serialize on the lock and publish an immutable tuple snapshot;
+    readers use the snapshot (or a single dict.get) without locking"""
+
     def __init__(self):
         self._events: Dict[str, Event] = {}
+        self._all_snapshot: Tuple[Event, ...] = ()
         self._lock = threading.RLock()
 
+    def _publish_snapshot(self) -> None:
+        """Rebuild the read snapshot. Caller must hold the lock"""
+        self._all_snapshot = tuple(self._events.values())
+
     def save_event(self, event: Event) -> None:
         """Save a new event to the repository"""
         with self._lock:
             if event.event_id in self._events:
                 raise ValueError(f"Event with ID {event.event_id} already exists")
             self._events[event.event_id] = event
+            self._publish_snapshot()
 
     def find_event_by_id(self, event_id: str) -> Optional[Event]:
         """Find an event by its ID"""
-        with self._lock:
-            return self._events.get(event_id)
+        return self._events.get(event_id)
 
-    def find_all_events(self) -> List[Event]:
-        """Retrieve all events"""
-        with self._lock:
-            return list(self._events.values())
+    def find_all_events(self) -> Sequence[Event]:
+        """Retrieve all events as an immutable snapshot"""
+        return self._all_snapshot
 
     def find_events_by_creator(self, creator_id: str) -> List[Event]:
         """Find all events created by a specific user"""
-        with self._lock:
-            return [event for event in self._events.values()
-                   if event.creator_id == creator_id]
+        return [event for event in self._all_snapshot
+               if event.creator_id == creator_id]
 
     def find_upcoming_events(self, minutes_ahead: int = 60) -> List[Event]:
         """Find events that are starting within specified minutes"""
-        with self._lock:
-            return [event for event in self._events.values()
-                   if event.is_upcoming(minutes_ahead)]
+        now_ns = time.time_ns()
+        return [event for event in self._all_snapshot
+               if event.is_upcoming_ns(now_ns, minutes_ahead)]
 
     def update_event(self, event: Event) -> None:
         """Update an existing event"""
@@ -171,22 +275,37 @@ class InMemoryEventRepository(EventRepository):
             if event.event_id not in self._events:
                 raise ValueError(f"Event with ID {event.event_id} not found")
             self._events[event.event_id] = event
+            self._publish_snapshot()
 
     def delete_event(self, event_id: str) -> bool:
         """Delete an event by ID. Returns True if deleted, False if not found"""
         with self._lock:
             if event_id in self._events:
                 del self._events[event_id]
+                self._publish_snapshot()
                 return True
             return False
 
+    def delete_all_events(self) -> None:
+        """Drop every event and publish an empty snapshot"""
+        with self._lock:
+            self._events = {}
+            self._all_snapshot = ()
+
+    def compact(self) -> None:
+        """Rebuild the event map so memory freed by deletes is returned"""
+        with self._lock:
+            self._events = dict(self._events)
+
 
 class InMemoryParticipantRepository(ParticipantRepository):
     def __init__(self):
-        self._participants: Dict[str, Participant] = {}
-        self._event_participants: Dict[str, List[str]] = {}  # event_id -> [participant_ids]
-        self._user_participants: Dict[str, List[str]] = {}   # user_id -> [participant_ids]
         self._lock = threading.RLock()
+        self._participants: Dict[str, Participant] = {}
+        # Insertion-ordered ID sets (dict keys) so removal is O(1) and listing order is stable.
+        # Lookups use .get/.pop so reads never materialize empty buckets
+        self._event_participants: DefaultDict[str, Dict[str, None]] = defaultdict(dict)  # event_id -> {participant_id}
+        self._user_participants: DefaultDict[str, Dict[str, None]] = defaultdict(dict)   # user_id -> {participant_id}
 
     def save_participant(self, participant: Participant) -> None:
         """Save a new participant to the repository"""
@@ -197,13 +316,8 @@ class InMemoryParticipantRepository(ParticipantRepository):
             self._participants[participant.participant_id] = participant
 
             # Update indexes
-            if participant.event_id not in self._event_participants:
-                self._event_participants[participant.event_id] = []
-            self._event_participants[participant.event_id].append(participant.participant_id)
-
-            if participant.user_id not in self._user_participants:
-                self._user_participants[participant.user_id] = []
-            self._user_participants[participant.user_id].append(participant.participant_id)
+            self._event_participants[participant.event_id][participant.participant_id] = None
+            self._user_participants[participant.user_id][participant.participant_id] = None
 
     def find_participant_by_id(self, participant_id: str) -> Optional[Participant]:
         """Find a participant by their ID"""
@@ -213,19 +327,24 @@ class InMemoryParticipantRepository(ParticipantRepository):
     def find_participants_by_event(self, event_id: str) -> List[Participant]:
         """Find all participants for a specific event"""
         with self._lock:
-            participant_ids = self._event_participants.get(event_id, [])
-            return [self._participants[pid] for pid in participant_ids if pid in self._participants]
+            # The index is maintained alongside the primary map, so every ID resolves
+            participants = self._participants
+            return [participants[pid] for pid in self._event_participants.get(event_id, ())]
 
     def find_participant_by_event_and_user(self, event_id: str, user_id: str) -> Optional[Participant]:
         """Find a participant by event and user combination"""
         with self._lock:
-            participants = self.find_participants_by_event(event_id)
-            return next((p for p in participants if p.user_id == user_id), None)
-
-    def find_all_participants(self) -> List[Participant]:
-        """Retrieve all participants"""
+            # A user joins few events, so walk the user index rather than the event's roster
+            for participant_id in self._user_participants.get(user_id, ()):
+                participant = self._participants[participant_id]
+                if participant.event_id == event_id:
+                    return participant
+            return None
+
+    def find_all_participants(self) -> Sequence[Participant]:
+        """Retrieve all participants as a snapshot tuple"""
         with self._lock:
-            return list(self._participants.values())
+            return tuple(self._participants.values())
 
     def update_participant(self, participant: Participant) -> None:
         """Update an existing participant"""
@@ -237,64 +356,110 @@ class InMemoryParticipantRepository(ParticipantRepository):
     def delete_participant(self, participant_id: str) -> bool:
         """Delete a participant by ID. Returns True if deleted, False if not found"""
         with self._lock:
-            if participant_id not in self._participants:
+            participant = self._participants.pop(participant_id, None)
+            if participant is None:
                 return False
 
-            participant = self._participants[participant_id]
-
             # Remove from indexes
-            if participant.event_id in self._event_participants:
-                self._event_participants[participant.event_id].remove(participant_id)
-                if not self._event_participants[participant.event_id]:
-                    del self._event_participants[participant.event_id]
-
-            if participant.user_id in self._user_participants:
-                self._user_participants[participant.user_id].remove(participant_id)
-                if not self._user_participants[participant.user_id]:
-                    del self._user_participants[participant.user_id]
-
-            del self._participants[participant_id]
+            _discard_from_index(self._event_participants, participant.event_id, participant_id)
+            _discard_from_index(self._user_participants, participant.user_id, participant_id)
             return True
 
     def delete_participants_by_event(self, event_id: str) -> int:
         """Delete all participants for an event. Returns number of participants deleted"""
         with self._lock:
-            if event_id not in self._event_participants:
+            # Detach the whole bucket at once; only the user index needs per-item cleanup
+            participant_ids = self._event_participants.pop(event_id, None)
+            if not participant_ids:
                 return 0
 
-            participant_ids = self._event_participants[event_id][:]
-            deleted_count = 0
-
             for participant_id in participant_ids:
-                if self.delete_participant(participant_id):
-                    deleted_count += 1
+                participant = self._participants.pop(participant_id)
+                _discard_from_index(self._user_participants, participant.user_id, participant_id)
 
-            return deleted_count
+            return len(participant_ids)
+
+    def delete_all_participants(self) -> None:
+        """Drop the participant map and both indexes in one step"""
+        with self._lock:
+            self._participants = {}
+            self._event_participants = defaultdict(dict)
+            self._user_participants = defaultdict(dict)
+
+    def compact(self) -> None:
+        """Rebuild the participant map and indexes so memory freed by deletes is returned"""
+        with self._lock:
+            self._participants = dict(self._participants)
+            self._event_participants = _rebuild_index(self._event_participants)
+            self._user_participants = _rebuild_index(self._user_participants)
 
 
 class InMemoryNotificationRepository(NotificationRepository):
     def __init__(self):
-        self._notifications: Dict[str, Notification] = {}
-        self._event_notifications: Dict[str, List[str]] = {}  # event_id -> [notification_ids]
-        self._participant_notifications: Dict[str, List[str]] = {}  # participant_id -> [notification_ids]
         self._lock = threading.RLock()
+        self._notifications: Dict[str, Notification] = {}
+        # Insertion-ordered ID sets (dict keys) so removal is O(1) and listing order is stable.
+        # Lookups use .get/.pop so reads never materialize empty buckets
+        self._event_notifications: DefaultDict[str, Dict[str, None]] = defaultdict(dict)  # event_id -> {notification_id}
+        self._participant_notifications: DefaultDict[str, Dict[str, None]] = defaultdict(dict)  # participant_id -> {notification_id}
+        # Pending index: a min-heap of (scheduled_ns, id) for unsent notifications that
+        # are not due yet, the live heap entry per id (entries not matching it are stale
+        # and skipped on pop), and the already-due unsent ids (insertion-ordered set)
+        self._unsent_by_time: List[Tuple[int, str]] = []
+        self._scheduled_unsent: Dict[str, int] = {}
+        self._due_unsent: Dict[str, None] = {}
+        # Min-heap of (sent_at, id) for cleanup; entries whose sent_at no longer matches
+        # the stored notification (deleted, re-sent, or updated) are stale and skipped
+        self._sent_by_time: List[Tuple[datetime, str]] = []
 
     def save_notification(self, notification: Notification) -> None:
         """Save a new notification to the repository"""
         with self._lock:
-            if notification.notification_id in self._notifications:
-                raise ValueError(f"Notification with ID {notification.notification_id} already exists")
-
-            self._notifications[notification.notification_id] = notification
+            self._insert_notification(notification)
 
-            # Update indexes
-            if notification.event_id not in self._event_notifications:
-                self._event_notifications[notification.event_id] = []
-            self._event_notifications[notification.event_id].append(notification.notification_id)
-
-            if notification.participant_id not in self._participant_notifications:
-                self._participant_notifications[notification.participant_id] = []
-            self._participant_notifications[notification.participant_id].append(notification.notification_id)
+    def save_notifications(self, notifications: List[Notification]) -> None:
+        """Save several new notifications to the repository in one call"""
+        with self._lock:
+            for notification in notifications:
+                self._insert_notification(notification)
+
+    def _insert_notification(self, notification: Notification) -> None:
+        """Store a notification and update indexes. Caller must hold the lock"""
+        if notification.notification_id in self._notifications:
+            raise ValueError(f"Notification with ID {notification.notification_id} already exists")
+
+        self._notifications[notification.notification_id] = notification
+
+        # Update indexes
+        self._event_notifications[notification.event_id][notification.notification_id] = None
+        self._participant_notifications[notification.participant_id][notification.notification_id] = None
+
+        self._index_pending(notification)
+
+    def _index_pending(self, notification: Notification) -> None:
+        """(Re)register a notification in the pending index. Caller must hold the lock"""
+        notification_id = notification.notification_id
+        self._unindex_pending(notification_id)
+        if not notification.is_sent:
+            self._scheduled_unsent[notification_id] = notification.scheduled_ns
+            heapq.heappush(self._unsent_by_time, (notification.scheduled_ns, notification_id))
+
+    def _unindex_pending(self, notification_id: str) -> None:
+        """Drop a notification from the pending index; its heap entry becomes stale"""
+        self._forget_pending(notification_id)
+        self._prune_pending_heap()
+
+    def _forget_pending(self, notification_id: str) -> None:
+        """Drop a notification from the pending maps. Bulk callers prune the heap once afterwards"""
+        self._scheduled_unsent.pop(notification_id, None)
+        self._due_unsent.pop(notification_id, None)
+
+    def _prune_pending_heap(self) -> None:
+        """Rebuild once stale entries dominate so the heap tracks live pending work"""
+        if len(self._unsent_by_time) > 2 * len(self._scheduled_unsent) + 64:
+            self._unsent_by_time = [(scheduled_ns, nid) for nid, scheduled_ns
+                                    in self._scheduled_unsent.items()]
+            heapq.heapify(self._unsent_by_time)
 
     def find_notification_by_id(self, notification_id: str) -> Optional[Notification]:
         """Find a notification by its ID"""
@@ -304,83 +469,188 @@ class InMemoryNotificationRepository(NotificationRepository):
     def find_notifications_by_event(self, event_id: str) -> List[Notification]:
         """Find all notifications for a specific event"""
         with self._lock:
-            notification_ids = self._event_notifications.get(event_id, [])
-            return [self._notifications[nid] for nid in notification_ids if nid in self._notifications]
+            notifications = self._notifications
+            return [notifications[nid] for nid in self._event_notifications.get(event_id, ())]
 
     def find_notifications_by_participant(self, participant_id: str) -> List[Notification]:
         """Find all notifications for a specific participant"""
         with self._lock:
-            notification_ids = self._participant_notifications.get(participant_id, [])
-            return [self._notifications[nid] for nid in notification_ids if nid in self._notifications]
+            notifications = self._notifications
+            return [notifications[nid] for nid in self._participant_notifications.get(participant_id, ())]
 
     def find_pending_notifications(self) -> List[Notification]:
         """Find all notifications that are ready to be sent but not yet sent"""
         with self._lock:
-            return [notification for notification in self._notifications.values()
-                   if notification.is_ready_to_send()]
+            self._refresh_due()
+            notifications = self._notifications
+            return [notifications[nid] for nid in self._due_unsent]
 
-    def find_all_notifications(self) -> List[Notification]:
-        """Retrieve all notifications"""
+    def count_pending_notifications(self) -> int:
+        """Count notifications that are ready to be sent but not yet sent"""
+        with self._lock:
+            self._refresh_due()
+            return len(self._due_unsent)
+
+    def find_scheduled_unsent_times(self) -> List[Tuple[int, str]]:
+        """Find (scheduled_ns, notification_id) for every unsent notification not yet due"""
+        with self._lock:
+            return [(scheduled_ns, notification_id)
+                    for notification_id, scheduled_ns in self._scheduled_unsent.items()]
+
+    def _refresh_due(self) -> None:
+        """Bring the due set up to date: admit newly due entries, drop sent ones.
+        Caller must hold the lock"""
+        now_ns = time.time_ns()
+        heap = self._unsent_by_time
+        scheduled = self._scheduled_unsent
+        # Move newly due entries off the heap, skipping stale ones
+        while heap and heap[0][0] <= now_ns:
+            scheduled_ns, notification_id = heapq.heappop(heap)
+            if scheduled.get(notification_id) == scheduled_ns:
+                del scheduled[notification_id]
+                self._due_unsent[notification_id] = None
+
+        # Catches notifications marked sent on the entity without going through the repository
+        notifications = self._notifications
+        stale_ids = [notification_id for notification_id in self._due_unsent
+                     if notifications[notification_id].is_sent]
+        for notification_id in stale_ids:
+            del self._due_unsent[notification_id]
+
+    def find_all_notifications(self) -> Sequence[Notification]:
+        """Retrieve all notifications as a snapshot tuple"""
         with self._lock:
-            return list(self._notifications.values())
+            return tuple(self._notifications.values())
 
     def update_notification(self, notification: Notification) -> None:
-        """Update an existing notification with additional validations"""
-        if not isinstance(notification, Notification):
-            raise TypeError("Provided object is not a Notification instance")
-        if not notification.notification_id or not isinstance(notification.notification_id, str):
-            raise ValueError("Notification must have a valid notification_id (non-empty string)")
-        if not notification.event_id or not isinstance(notification.event_id, str):
-            raise ValueError("Notification must have a valid event_id (non-empty string)")
-        if not notification.participant_id or not isinstance(notification.participant_id, str):
-            raise ValueError("Notification must have a valid participant_id (non-empty string)")
-        if not notification.message or not isinstance(notification.message, str):
-            raise ValueError("Notification must have a valid message (non-empty string)")
-        if notification.scheduled_time is None or not isinstance(notification.scheduled_time, datetime):
-            raise ValueError("Notification must have a valid scheduled_time (datetime object)")
-        if notification.notification_type is None:
-            raise ValueError("Notification must have a valid notification_type")
+        """Update an existing notification (see update_notification_strict for untrusted input)"""
         with self._lock:
-            if notification.notification_id not in self._notifications:
+            existing = self._notifications.get(notification.notification_id)
+            if existing is None:
                 raise ValueError(f"Notification with ID {notification.notification_id} not found")
-            # Prevent changing the notification_id
-            existing = self._notifications[notification.notification_id]
-            if notification.notification_id != existing.notification_id:
-                raise ValueError("Cannot change notification_id of an existing notification")
-            # Optionally, prevent changing event_id and participant_id for integrity
+            # Prevent changing event_id and participant_id for integrity
             if notification.event_id != existing.event_id:
                 raise ValueError("Cannot change event_id of an existing notification")
             if notification.participant_id != existing.participant_id:
                 raise ValueError("Cannot change participant_id of an existing notification")
             self._notifications[notification.notification_id] = notification
+            # Picks up a changed scheduled time or sent state
+            self._index_pending(notification)
+            # A new cleanup entry only when sent_at changed; an object updated in place
+            # can't be compared with its old state, so it is always re-registered
+            if notification.sent_at is not None and (
+                    notification is existing or notification.sent_at != existing.sent_at):
+                self._index_sent(notification)
 
     def delete_notification(self, notification_id: str) -> bool:
         """Delete a notification by ID. Returns True if deleted, False if not found"""
         with self._lock:
-            if notification_id not in self._notifications:
+            notification = self._notifications.pop(notification_id, None)
+            if notification is None:
                 return False
 
-            notification = self._notifications[notification_id]
-
             # Remove from indexes
-            if notification.event_id in self._event_notifications:
-                self._event_notifications[notification.event_id].remove(notification_id)
-                if not self._event_notifications[notification.event_id]:
-                    del self._event_notifications[notification.event_id]
-
-            if notification.participant_id in self._participant_notifications:
-                self._participant_notifications[notification.participant_id].remove(notification_id)
-                if not self._participant_notifications[notification.participant_id]:
-                    del self._participant_notifications[notification.participant_id]
-
-            del self._notifications[notification_id]
+            _discard_from_index(self._event_notifications, notification.event_id, notification_id)
+            _discard_from_index(self._participant_notifications, notification.participant_id, notification_id)
+            self._unindex_pending(notification_id)
             return True
 
+    def delete_notifications_by_event(self, event_id: str) -> List[Notification]:
+        """Delete all notifications for an event. Returns the deleted notifications"""
+        with self._lock:
+            deleted = []
+            for notification_id in self._event_notifications.pop(event_id, ()):
+                notification = self._notifications.pop(notification_id)
+                _discard_from_index(self._participant_notifications, notification.participant_id,
+                                    notification_id)
+                self._forget_pending(notification_id)
+                deleted.append(notification)
+            self._prune_pending_heap()
+            return deleted
+
+    def delete_notifications_by_participant(self, participant_id: str) -> List[Notification]:
+        """Delete all notifications for a participant. Returns the deleted notifications"""
+        with self._lock:
+            deleted = []
+            for notification_id in self._participant_notifications.pop(participant_id, ()):
+                notification = self._notifications.pop(notification_id)
+                _discard_from_index(self._event_notifications, notification.event_id, notification_id)
+                self._forget_pending(notification_id)
+                deleted.append(notification)
+            self._prune_pending_heap()
+            return deleted
+
+    def delete_notifications_sent_before(self, cutoff: datetime) -> List[Notification]:
+        """Delete notifications sent before the cutoff. Returns the deleted notifications"""
+        with self._lock:
+            heap = self._sent_by_time
+            notifications = self._notifications
+            deleted = []
+            while heap and heap[0][0] < cutoff:
+                sent_at, notification_id = heapq.heappop(heap)
+                notification = notifications.get(notification_id)
+                if notification is None or notification.sent_at != sent_at:
+                    continue
+                del notifications[notification_id]
+                _discard_from_index(self._event_notifications, notification.event_id, notification_id)
+                _discard_from_index(self._participant_notifications, notification.participant_id,
+                                    notification_id)
+                self._forget_pending(notification_id)
+                deleted.append(notification)
+            self._prune_pending_heap()
+            return deleted
+
+    def _index_sent(self, notification: Notification) -> None:
+        """Register a notification's send time for cleanup. Caller must hold the lock"""
+        heapq.heappush(self._sent_by_time, (notification.sent_at, notification.notification_id))
+
+    def delete_all_notifications(self) -> None:
+        """Drop the notification map and every index in one step"""
+        with self._lock:
+            self._notifications = {}
+            self._event_notifications = defaultdict(dict)
+            self._participant_notifications = defaultdict(dict)
+            self._unsent_by_time = []
+            self._scheduled_unsent = {}
+            self._due_unsent = {}
+            self._sent_by_time = []
+
+    def compact(self) -> None:
+        """Rebuild the notification map and indexes so memory freed by deletes is returned"""
+        with self._lock:
+            self._notifications = dict(self._notifications)
+            self._event_notifications = _rebuild_index(self._event_notifications)
+            self._participant_notifications = _rebuild_index(self._participant_notifications)
+            self._scheduled_unsent = dict(self._scheduled_unsent)
+            self._due_unsent = dict(self._due_unsent)
+            self._unsent_by_time = [(scheduled_ns, nid) for nid, scheduled_ns
+                                    in self._scheduled_unsent.items()]
+            heapq.heapify(self._unsent_by_time)
+            self._sent_by_time = [(notification.sent_at, nid) for nid, notification
+                                  in self._notifications.items() if notification.sent_at is not None]
+            heapq.heapify(self._sent_by_time)
+
     def mark_notification_as_sent(self, notification_id: str) -> bool:
         """Mark a notification as sent. Returns True if updated, False if not found"""
         with self._lock:
-            notification = self.find_notification_by_id(notification_id)
-            if notification:
-                notification.mark_as_sent()
-                return True
-            return False
+            notification = self._notifications.get(notification_id)
+            if notification is None:
+                return False
+            notification.mark_as_sent()
+            self._unindex_pending(notification_id)
+            self._index_sent(notification)
+            return True
+
+    def mark_notifications_sent_bulk(self, notification_ids: List[str]) -> Set[str]:
+        """Mark several unsent notifications as sent. Returns the IDs that were marked"""
+        with self._lock:
+            marked = set()
+            for notification_id in notification_ids:
+                notification = self._notifications.get(notification_id)
+                if notification and not notification.is_sent:
+                    notification.mark_as_sent()
+                    self._forget_pending(notification_id)
+                    self._index_sent(notification)
+                    marked.add(notification_id)
+            self._prune_pending_heap()
+            return marked
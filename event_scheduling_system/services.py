@@ -1,23 +1,111 @@
 from abc import ABC, abstractmethod
+import asyncio
+import atexit
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+import logging
+import os
 import time
 import threading
 from entities import Notification, NotificationType
 
 
+logger = logging.getLogger(__name__)
+
+# Set NOTIF_SIMULATE=0 to skip the mock services' simulated network delay (tests, benchmarks)
+_SIMULATE_LATENCY = os.getenv("NOTIF_SIMULATE", "1") == "1"
+# Set NOTIF_QUIET=1 to skip per-send log records entirely (bulk runs)
+_LOG_SENDS = os.getenv("NOTIF_QUIET", "0") != "1"
+
+# One delivery pool shared by every dispatcher, so systems created in quick succession
+# (e.g. one per test) reuse threads instead of each spawning their own
+_DELIVERY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+_DELIVERY_EXECUTOR = ThreadPoolExecutor(max_workers=_DELIVERY_WORKERS,
+                                        thread_name_prefix="notification-delivery")
+atexit.register(_DELIVERY_EXECUTOR.shutdown, wait=False)
+
+# Unroutable sends per notification type, so a misrouted stream logs a sample, not every send
+_MISSING_SERVICE_LOG_BURST = 10
+_missing_service_counts: Counter = Counter()
+
+
+def _log_missing_service(notification_type: NotificationType) -> None:
+    """Log an unroutable notification: the first few per type, then at powers of two"""
+    count = _missing_service_counts[notification_type]
+    _missing_service_counts[notification_type] = count + 1
+    if count < _MISSING_SERVICE_LOG_BURST or count & (count - 1) == 0:
+        logger.error("❌ No service registered for notification type: %s (count=%d)",
+                     notification_type, count + 1)
+
+
 class NotificationService(ABC):
+    """A delivery channel. send_notification is called concurrently from the dispatcher's
+    pool, so implementations should guard only genuinely shared clients, not the whole send"""
+
     @abstractmethod
     def send_notification(self, notification: Notification) -> bool:
         """Send a notification. Returns True if sent successfully, False otherwise"""
         pass
 
+    def send_batch(self, notifications: list[Notification]) -> dict[str, bool]:
+        """Send several notifications of this service's type. Returns notification_id -> success.
+        Override to share one connection or session across the batch"""
+        return {notification.notification_id: self.send_notification(notification)
+                for notification in notifications}
+
+    async def send_notification_async(self, notification: Notification) -> bool:
+        """Async variant of send_notification. The default runs the blocking send in a
+        worker thread; services with a native async client should override it"""
+        return await asyncio.to_thread(self.send_notification, notification)
+
     @abstractmethod
     def get_service_type(self) -> NotificationType:
         """Get the type of notification this service handles"""
         pass
 
 
-class EmailService(NotificationService):
+class SimulatedNotificationService(NotificationService):
+    """Base for the mock services: one simulated network round-trip per call,
+    so a batch pays a single delay rather than one per notification"""
+
+    SIMULATED_DELAY = 0.0
+
+    def send_notification(self, notification: Notification) -> bool:
+        """Send a notification. Returns True if sent successfully, False otherwise"""
+        sent = self._deliver(notification)
+        if sent:
+            self._simulate_network_delay()
+        return sent
+
+    def send_batch(self, notifications: list[Notification]) -> dict[str, bool]:
+        """Send several notifications over one simulated round-trip"""
+        results = {notification.notification_id: self._deliver(notification)
+                   for notification in notifications}
+        if any(results.values()):
+            self._simulate_network_delay()
+        return results
+
+    async def send_notification_async(self, notification: Notification) -> bool:
+        """Send a notification, awaiting the simulated delay instead of blocking a thread"""
+        sent = self._deliver(notification)
+        if sent and _SIMULATE_LATENCY:
+            await asyncio.sleep(self.SIMULATED_DELAY)
+        return sent
+
+    def _simulate_network_delay(self) -> None:
+        if _SIMULATE_LATENCY:
+            time.sleep(self.SIMULATED_DELAY)
+
+    @abstractmethod
+    def _deliver(self, notification: Notification) -> bool:
+        """Hand one notification to the channel, without the network delay"""
+        pass
+
+
+class EmailService(SimulatedNotificationService):
+    SIMULATED_DELAY = 0.1
+
     def __init__(self, smtp_server: str = "smtp.example.com",
                  smtp_port: int = 587, username: str = "",
                  password: str = ""):
@@ -25,87 +113,77 @@ class EmailService(NotificationService):
         self.smtp_port = smtp_port
         self.username = username
         self.password = password
-        self._lock = threading.RLock()
 
-    def send_notification(self, notification: Notification) -> bool:
+    def _deliver(self, notification: Notification) -> bool:
         """Send an email notification"""
-        with self._lock:
-            if notification.notification_type != NotificationType.EMAIL:
-                return False
-
-            try:
-                # Simulate email sending with a delay
-                print("📧 [EMAIL SERVICE] Sending email notification...")
-                print(f"   To: {notification.participant_id}")  # In real app, this would be actual email
-                print(f"   Subject: Event Notification")
-                print(f"   Message: {notification.message}")
-                print("   Status: SENT ✅")
-                time.sleep(0.1)  # Simulate network delay
-                return True
-            except Exception as e:
-                print(f"❌ [EMAIL SERVICE] Failed to send email: {e}")
-                return False
+        if notification.notification_type != NotificationType.EMAIL:
+            return False
+
+        try:
+            # Simulate email sending (in a real app the recipient would be an email address)
+            if _LOG_SENDS:
+                logger.info("📧 [EMAIL SERVICE] SENT ✅ to %s | Subject: Event Notification | %s",
+                            notification.participant_id, notification.message)
+            return True
+        except Exception:
+            logger.exception("❌ [EMAIL SERVICE] Failed to send email")
+            return False
 
     def get_service_type(self) -> NotificationType:
         return NotificationType.EMAIL
 
 
-class SMSService(NotificationService):
+class SMSService(SimulatedNotificationService):
+    SIMULATED_DELAY = 0.15
+
     def __init__(self, api_key: str = "", api_secret: str = "",
                  provider_url: str = "https://api.sms-provider.com"):
         self.api_key = api_key
         self.api_secret = api_secret
         self.provider_url = provider_url
-        self._lock = threading.RLock()
 
-    def send_notification(self, notification: Notification) -> bool:
+    def _deliver(self, notification: Notification) -> bool:
         """Send an SMS notification"""
-        with self._lock:
-            if notification.notification_type != NotificationType.SMS:
-                return False
-
-            try:
-                # Simulate SMS sending with a delay
-                print("📱 [SMS SERVICE] Sending SMS notification...")
-                print(f"   To: {notification.participant_id}")  # In real app, this would be actual phone
-                print(f"   Message: {notification.message}")
-                print("   Status: SENT ✅")
-                time.sleep(0.15)  # Simulate network delay
-                return True
-            except Exception as e:
-                print(f"❌ [SMS SERVICE] Failed to send SMS: {e}")
-                return False
+        if notification.notification_type != NotificationType.SMS:
+            return False
+
+        try:
+            # Simulate SMS sending (in a real app the recipient would be a phone number)
+            if _LOG_SENDS:
+                logger.info("📱 [SMS SERVICE] SENT ✅ to %s | %s",
+                            notification.participant_id, notification.message)
+            return True
+        except Exception:
+            logger.exception("❌ [SMS SERVICE] Failed to send SMS")
+            return False
 
     def get_service_type(self) -> NotificationType:
         return NotificationType.SMS
 
 
-class PushNotificationService(NotificationService):
+class PushNotificationService(SimulatedNotificationService):
+    SIMULATED_DELAY = 0.05
+
     def __init__(self, app_id: str = "", server_key: str = "",
                  fcm_url: str = "https://fcm.googleapis.com/fcm/send"):
         self.app_id = app_id
         self.server_key = server_key
         self.fcm_url = fcm_url
-        self._lock = threading.RLock()
 
-    def send_notification(self, notification: Notification) -> bool:
+    def _deliver(self, notification: Notification) -> bool:
         """Send a push notification"""
-        with self._lock:
-            if notification.notification_type != NotificationType.PUSH:
-                return False
-
-            try:
-                # Simulate push notification sending with a delay
-                print("🔔 [PUSH SERVICE] Sending push notification...")
-                print(f"   To: {notification.participant_id}")  # In real app, this would be device token
-                print(f"   Title: Event Reminder")
-                print(f"   Message: {notification.message}")
-                print("   Status: SENT ✅")
-                time.sleep(0.05)  # Simulate network delay
-                return True
-            except Exception as e:
-                print(f"❌ [PUSH SERVICE] Failed to send push notification: {e}")
-                return False
+        if notification.notification_type != NotificationType.PUSH:
+            return False
+
+        try:
+            # Simulate push notification sending (in a real app the recipient would be a device token)
+            if _LOG_SENDS:
+                logger.info("🔔 [PUSH SERVICE] SENT ✅ to %s | Title: Event Reminder | %s",
+                            notification.participant_id, notification.message)
+            return True
+        except Exception:
+            logger.exception("❌ [PUSH SERVICE] Failed to send push notification")
+            return False
 
     def get_service_type(self) -> NotificationType:
         return NotificationType.PUSH
@@ -114,30 +192,76 @@ class PushNotificationService(NotificationService):
 class NotificationDispatcher:
     """Dispatcher to route notifications to appropriate services"""
 
+    MAX_WORKERS = _DELIVERY_WORKERS
+
     def __init__(self):
+        # Copy-on-write: register_service publishes a new dict, so senders read without locking
         self.services: dict[NotificationType, NotificationService] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
 
     def register_service(self, service: NotificationService) -> None:
         """Register a notification service"""
         with self._lock:
-            self.services[service.get_service_type()] = service
+            services = dict(self.services)
+            services[service.get_service_type()] = service
+            self.services = services
 
     def send_notification(self, notification: Notification) -> bool:
         """Send a notification using the appropriate service"""
-        with self._lock:
-            service = self.services.get(notification.notification_type)
-            if not service:
-                print(f"❌ No service registered for notification type: {notification.notification_type}")
-                return False
+        service = self.services.get(notification.notification_type)
+        if not service:
+            _log_missing_service(notification.notification_type)
+            return False
+
+        return service.send_notification(notification)
 
-            return service.send_notification(notification)
+    async def send_notification_async(self, notification: Notification) -> bool:
+        """Async variant of send_notification"""
+        service = self.services.get(notification.notification_type)
+        if not service:
+            _log_missing_service(notification.notification_type)
+            return False
+
+        return await service.send_notification_async(notification)
+
+    async def send_bulk_notifications_async(self, notifications: list[Notification]) -> dict[str, bool]:
+        """Send multiple notifications concurrently on the running event loop.
+        Returns dict of notification_id -> success"""
+        results = await asyncio.gather(
+            *(self.send_notification_async(notification) for notification in notifications)
+        )
+        return {notification.notification_id: success
+                for notification, success in zip(notifications, results)}
 
     def send_bulk_notifications(self, notifications: list[Notification]) -> dict[str, bool]:
         """Send multiple notifications. Returns dict of notification_id -> success"""
-        results = {}
+        groups: dict[NotificationType, list[Notification]] = defaultdict(list)
         for notification in notifications:
-            notification_id = notification.notification_id
-            success = self.send_notification(notification)
-            results[notification_id] = success
+            groups[notification.notification_type].append(notification)
+
+        # Unroutable notifications stay False; keys keep the input order
+        results = dict.fromkeys(
+            (notification.notification_id for notification in notifications), False
+        )
+        # Slice each channel's group so the whole call makes about MAX_WORKERS batches
+        chunk_size = max(1, -(-len(notifications) // self.MAX_WORKERS))
+        batches = []
+        services = self.services
+        for notification_type, group in groups.items():
+            service = services.get(notification_type)
+            if not service:
+                _log_missing_service(notification_type)
+                continue
+            batches.extend((service, group[start:start + chunk_size])
+                           for start in range(0, len(group), chunk_size))
+
+        if len(batches) == 1:
+            # Not worth a pool round-trip for a single batch
+            service, batch = batches[0]
+            results.update(service.send_batch(batch))
+        else:
+            futures = [_DELIVERY_EXECUTOR.submit(service.send_batch, batch)
+                       for service, batch in batches]
+            for future in futures:
+                results.update(future.result())
         return results
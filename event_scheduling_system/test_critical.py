@@ -3,25 +3,29 @@ Minimal Test Cases for Event Scheduling System
 Tests only critical functions and core functionality
 """
 
+import asyncio
+import time
 import unittest
 from datetime import datetime, timedelta
 from orchestrator import EventSchedulingSystem
 from entities import NotificationType
+from services import NotificationDispatcher, EmailService
 
 
 class TestEventSchedulingCritical(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the system once; tests share it and reset it in tearDown"""
+        cls.system = EventSchedulingSystem()
+
     def setUp(self):
         """Set up test fixtures"""
-        self.system = EventSchedulingSystem()
         self.now = datetime.now()
 
     def tearDown(self):
         """Clean up after each test"""
-        # Clean up all events
-        events = self.system.get_all_events()
-        for event in events:
-            self.system.delete_event(event.event_id)
+        self.system.reset()
 
     def test_event_creation_validation(self):
         """Test event creation with validation"""
@@ -125,6 +129,165 @@ class TestEventSchedulingCritical(unittest.TestCase):
         pending_count = len(self.system.get_pending_notifications())
         self.assertGreaterEqual(pending_count, 0)
 
+    def test_pending_notifications_tracking(self):
+        """Test that due notifications are pending in scheduled order until sent"""
+        # Reminders for these events fall due 20s and 40s ago; the third is 45 minutes out
+        later_due = self.system.create_event(
+            title="Later Due",
+            description="Test",
+            start_time=self.now + timedelta(seconds=40),
+            end_time=self.now + timedelta(hours=1),
+            creator_id="user123"
+        )
+        earlier_due = self.system.create_event(
+            title="Earlier Due",
+            description="Test",
+            start_time=self.now + timedelta(seconds=20),
+            end_time=self.now + timedelta(hours=1),
+            creator_id="user123"
+        )
+        not_due = self.system.create_event(
+            title="Not Due",
+            description="Test",
+            start_time=self.now + timedelta(hours=1),
+            end_time=self.now + timedelta(hours=2),
+            creator_id="user123"
+        )
+        for event in (later_due, earlier_due, not_due):
+            self.system.add_participant(
+                event_id=event.event_id,
+                user_id="user456",
+                name="John Doe",
+                email="john@example.com"
+            )
+
+        later = self.system.schedule_event_notifications(later_due.event_id, minutes_before=1)
+        earlier = self.system.schedule_event_notifications(earlier_due.event_id, minutes_before=1)
+        self.system.schedule_event_notifications(not_due.event_id, minutes_before=15)
+
+        # Earliest scheduled first, regardless of scheduling order
+        pending = self.system.get_pending_notifications()
+        self.assertEqual([n.notification_id for n in pending],
+                         [n.notification_id for n in earlier + later])
+        self.assertEqual(self.system.get_system_stats()["pending_notifications"], 4)
+
+        # Sent notifications leave the pending set; the not-yet-due ones stay out of it
+        sent = self.system.send_pending_notifications()
+        self.assertEqual(len(sent), 4)
+        self.assertEqual(self.system.get_pending_notifications(), [])
+        stats = self.system.get_system_stats()
+        self.assertEqual(stats["pending_notifications"], 0)
+        self.assertEqual(stats["sent_notifications"], 4)
+        self.assertEqual(stats["total_notifications"], 6)
+
+    def test_notification_indexes_survive_compact(self):
+        """Test lookups, pending tracking and cleanup after storage is compacted"""
+        big_event = self.system.create_event(
+            title="Big Event",
+            description="Test",
+            start_time=self.now + timedelta(seconds=30),
+            end_time=self.now + timedelta(hours=1),
+            creator_id="user123"
+        )
+        small_event = self.system.create_event(
+            title="Small Event",
+            description="Test",
+            start_time=self.now + timedelta(seconds=30),
+            end_time=self.now + timedelta(hours=1),
+            creator_id="user123"
+        )
+        for i in range(5):
+            self.system.add_participant(
+                event_id=big_event.event_id,
+                user_id=f"user{i}",
+                name="Big Guest",
+                email=f"guest{i}@example.com"
+            )
+        self.system.add_participant(
+            event_id=small_event.event_id,
+            user_id="user456",
+            name="John Doe",
+            email="john@example.com"
+        )
+        self.system.schedule_event_notifications(big_event.event_id, minutes_before=1)
+        kept = self.system.schedule_event_notifications(small_event.event_id, minutes_before=1)
+
+        # Deleting most of the storage triggers a compaction; call it again explicitly too
+        self.system.delete_event(big_event.event_id)
+        self.system.notification_repository.compact()
+
+        self.assertEqual(self.system.get_event_notifications(small_event.event_id), kept)
+        self.assertEqual(self.system.get_pending_notifications(), kept)
+        self.assertEqual(len(self.system.send_pending_notifications()), len(kept))
+        self.assertEqual(self.system.get_pending_notifications(), [])
+
+        # The send-time index is rebuilt by compact(), so cleanup still finds sent notifications
+        self.system.notification_repository.compact()
+        self.assertEqual(self.system.cleanup_old_notifications(days_old=-1), len(kept))
+        self.assertEqual(self.system.get_event_notifications(small_event.event_id), [])
+        self.assertEqual(self.system.get_system_stats()["total_notifications"], 0)
+
+    def test_async_notification_sending(self):
+        """Test the asyncio send path routes each notification to its service"""
+        event = self.system.create_event(
+            title="Test Event",
+            description="Test",
+            start_time=self.now + timedelta(hours=1),
+            end_time=self.now + timedelta(hours=2),
+            creator_id="user123"
+        )
+        self.system.add_participant(
+            event_id=event.event_id,
+            user_id="user456",
+            name="John Doe",
+            email="john@example.com",
+            phone="+1234567890"
+        )
+        notifications = self.system.schedule_event_notifications(event.event_id, minutes_before=15)
+        self.assertEqual(len(notifications), 3)  # email, SMS and push
+
+        # Bulk: every channel is registered, so every send succeeds
+        results = asyncio.run(
+            self.system.notification_dispatcher.send_bulk_notifications_async(notifications)
+        )
+        self.assertEqual(results, {n.notification_id: True for n in notifications})
+
+        # Single sends: a channel without a registered service reports failure
+        email_only = NotificationDispatcher()
+        email_only.register_service(EmailService())
+        by_type = {n.notification_type: n for n in notifications}
+        self.assertTrue(asyncio.run(email_only.send_notification_async(by_type[NotificationType.EMAIL])))
+        self.assertFalse(asyncio.run(email_only.send_notification_async(by_type[NotificationType.PUSH])))
+
+    def test_processor_wakes_for_notifications_scheduled_before_start(self):
+        """Test a processor started after scheduling still wakes when the reminder falls due"""
+        event = self.system.create_event(
+            title="Soon",
+            description="Test",
+            start_time=self.now + timedelta(seconds=61),
+            end_time=self.now + timedelta(hours=1),
+            creator_id="user123"
+        )
+        self.system.add_participant(
+            event_id=event.event_id,
+            user_id="user456",
+            name="John Doe",
+            email="john@example.com"
+        )
+        # Due in about a second: email and push
+        self.system.schedule_event_notifications(event.event_id, minutes_before=1)
+        self.assertEqual(self.system.get_pending_notifications(), [])
+
+        # The 30s check interval only caps the wait; the processor must wake at the due time
+        self.system.start_notification_processor(check_interval_seconds=30)
+        deadline = time.monotonic() + 10
+        while (self.system.get_system_stats()["sent_notifications"] < 2
+               and time.monotonic() < deadline):
+            time.sleep(0.05)
+        self.system.stop_notification_processor()
+
+        self.assertEqual(self.system.get_system_stats()["sent_notifications"], 2)
+
     def test_system_integration_workflow(self):
         """Test complete workflow from event creation to cleanup"""
         # Create event
@@ -162,6 +325,8 @@ class TestEventSchedulingCritical(unittest.TestCase):
         # Verify cleanup
         final_stats = self.system.get_system_stats()
         self.assertEqual(final_stats['total_events'], 0)
+        self.assertEqual(final_stats['total_participants'], 0)
+        self.assertEqual(final_stats['total_notifications'], 0)
 
     def test_error_handling(self):
         """Test error handling for invalid operations"""
@@ -8,6 +8,14 @@ Trade-offs: Granular error handling vs exception proliferation
 """
 
 
+# Message templates, %-formatted on construction (validation can raise in tight loops)
+_NOT_FOUND_TEMPLATE = "%s with ID '%s' not found"
+_ALREADY_EXISTS_TEMPLATE = "%s with ID '%s' already exists"
+_INVALID_BOOKING_TEMPLATE = "Invalid booking: %s"
+_CAPACITY_TEMPLATE = "Flight %s capacity error: %s"
+_VALIDATION_TEMPLATE = "Validation error for %s: %s"
+
+
 class FlightReservationError(Exception):
     """Base exception for all flight reservation system errors"""
     pass
@@ -19,7 +27,7 @@ class EntityNotFoundError(FlightReservationError):
     def __init__(self, entity_type: str, entity_id: str) -> None:
         self.entity_type = entity_type
         self.entity_id = entity_id
-        super().__init__(f"{entity_type} with ID '{entity_id}' not found")
+        super().__init__(_NOT_FOUND_TEMPLATE % (entity_type, entity_id))
 
 
 class EntityAlreadyExistsError(FlightReservationError):
@@ -30,14 +38,14 @@ class EntityAlreadyExistsError(FlightReservationError):
         self.entity_id = entity_id
         # Even though FlightReservationError does not define its own __init__, it inherits from Exception,
         # which does have an __init__ that accepts a message. So, super() here calls Exception.__init__.
-        super().__init__(f"{entity_type} with ID '{entity_id}' already exists")
+        super().__init__(_ALREADY_EXISTS_TEMPLATE % (entity_type, entity_id))
 
 
 class InvalidBookingError(FlightReservationError):
     """Raised when a booking operation is invalid"""
     
     def __init__(self, message: str) -> None:
-        super().__init__(f"Invalid booking: {message}")
+        super().__init__(_INVALID_BOOKING_TEMPLATE % (message,))
 
 
 class FlightCapacityError(FlightReservationError):
@@ -45,7 +53,7 @@ class FlightCapacityError(FlightReservationError):
     
     def __init__(self, flight_id: str, message: str) -> None:
         self.flight_id = flight_id
-        super().__init__(f"Flight {flight_id} capacity error: {message}")
+        super().__init__(_CAPACITY_TEMPLATE % (flight_id, message))
 
 
 class ValidationError(FlightReservationError):
@@ -53,4 +61,5 @@ class ValidationError(FlightReservationError):
     
     def __init__(self, field: str, message: str) -> None:
         self.field = field
-        super().__init__(f"Validation error for {field}: {message}")
+        self.message = message
+        super().__init__(_VALIDATION_TEMPLATE % (field, message))
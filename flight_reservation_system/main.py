@@ -52,11 +52,16 @@ Design Guidelines:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import DefaultDict, FrozenSet, Iterable, List, Optional, Dict, Set, Tuple, ValuesView
+from collections import defaultdict
 from datetime import datetime
+import sys
 import threading
+import time
 from dataclasses import dataclass
+from enum import IntEnum
 import re
+import string
 
 from exceptions import (
     EntityNotFoundError, EntityAlreadyExistsError, 
@@ -64,16 +69,73 @@ from exceptions import (
 )
 
 
+_NS_PER_SECOND = 1_000_000_000
+
+# Sentinel for dict.pop so a remove is a single lookup (stored values are never this object)
+_MISSING = object()
+
+# Input formats, compiled once at import. \Z (not $) so a trailing newline is rejected.
+# Emails are split on their single '@' and each half matched separately, which keeps
+# the domain pattern from backtracking across the local part on near-misses
+_EMAIL_LOCAL_RE = re.compile(r'\A[A-Za-z0-9._%+\-]+\Z')
+_EMAIL_DOMAIN_RE = re.compile(r'\A[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\Z')
+# Passports are short, so a length check plus a set-containment scan beats the regex VM
+_PASSPORT_CHARS = frozenset(string.ascii_uppercase + string.digits)
+
+
+def _nonblank(value: str) -> bool:
+    """True if value has a non-whitespace character. Unlike strip(), isspace()
+    stops at the first such character and allocates nothing"""
+    return bool(value) and not value.isspace()
+
+
+def _valid_id(value: str) -> bool:
+    """True if value is a non-blank str. IDs are keys throughout, so non-str values
+    are rejected here rather than failing later inside a repository"""
+    return type(value) is str and bool(value) and not value.isspace()
+
+
+# Airport codes already accepted, mapped to their upper-case form, so repeat searches
+# skip re-validating the same code. Capped because search input is caller-controlled
+_VALIDATED_AIRPORT_CODES: Dict[str, str] = {}
+_VALIDATED_AIRPORT_CODES_LIMIT = 4096
+
+
+def _validate_airport_code(field: str, code: str) -> str:
+    """Check code is a 3-letter airport code and return it upper-cased"""
+    normalized = _VALIDATED_AIRPORT_CODES.get(code)
+    if normalized is None:
+        # isascii() reads a flag on the string object, and ASCII-only isalpha() is a
+        # table lookup per byte, so non-Latin letters are rejected before any Unicode scan
+        if len(code) != 3 or not code.isascii() or not code.isalpha():
+            raise ValidationError(field, f"{field.capitalize()} must be a 3-letter airport code")
+        normalized = code.upper()
+        if len(_VALIDATED_AIRPORT_CODES) < _VALIDATED_AIRPORT_CODES_LIMIT:
+            _VALIDATED_AIRPORT_CODES[code] = normalized
+    return normalized
+
+
+# Writer locks striped by entity ID: writes to different IDs rarely share a lock,
+# while two writes to the same ID are always serialized
+_LOCK_SHARD_COUNT = 64
+_LOCK_SHARDS = [threading.Lock() for _ in range(_LOCK_SHARD_COUNT)]
+
+
+def _lock_for(entity_id: str) -> threading.Lock:
+    """Return the shard lock guarding writes to entity_id"""
+    return _LOCK_SHARDS[hash(entity_id) & (_LOCK_SHARD_COUNT - 1)]
+
+
 # ============================================================================
 # PART 1: MVP CORE ENTITIES (Data + Basic Invariants Only)
 # ============================================================================
 
 # Design Pattern: Value Object / Entity
 # Purpose: Represent core business concept with basic invariants
-# Implementation: Data class with constructor validation
+# Implementation: Slotted data class with constructor validation
 # Trade-offs: Simplicity vs rich domain methods
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity representing a system user"""
     # user_id: unique identifier for user lookup
@@ -87,10 +149,13 @@ class User:
         # Basic null checks only in MVP
         if not self.user_id or not self.name or not self.email:
             raise ValueError("User ID, name, and email are required")
+        # IDs are interned so the copies held as dict keys and on entities are one object,
+        # letting dict lookups succeed on the identity check before comparing characters
+        self.user_id = sys.intern(self.user_id)
         # Extension point: add email_validation() post-MVP (Strategy Pattern)
 
 
-@dataclass
+@dataclass(slots=True)
 class Flight:
     """Flight entity representing available flights"""
     # flight_id: unique identifier for flight lookup
@@ -108,12 +173,17 @@ class Flight:
         # Basic null checks only in MVP
         if not self.flight_id or not self.flight_number or not self.source or not self.destination:
             raise ValueError("Flight ID, number, source, and destination are required")
+        self.flight_id = sys.intern(self.flight_id)
         if self.capacity <= 0:
             raise ValueError("Flight capacity must be positive")
+        # Airport codes are stored upper-case (IATA style) and interned: codes repeat
+        # across many flights, and route lookups then need no per-flight case folding
+        self.source = sys.intern(self.source.upper())
+        self.destination = sys.intern(self.destination.upper())
         # Extension point: add route_validation() post-MVP (Specification Pattern)
 
 
-@dataclass
+@dataclass(slots=True)
 class Passenger:
     """Passenger entity representing a person who can book flights"""
     # passenger_id: unique identifier for passenger lookup
@@ -129,30 +199,49 @@ class Passenger:
         # Basic null checks only in MVP
         if not self.passenger_id or not self.user_id or not self.name or not self.passport_number:
             raise ValueError("Passenger ID, user ID, name, and passport number are required")
+        self.passenger_id = sys.intern(self.passenger_id)
+        self.user_id = sys.intern(self.user_id)
         # Extension point: add passport_validation() post-MVP (Strategy Pattern)
 
 
-@dataclass
+class BookingStatus(IntEnum):
+    """Lifecycle state of a booking; int-valued so status checks are integer compares"""
+    CONFIRMED = 1
+    CANCELLED = 2
+    
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+@dataclass(slots=True)
 class Booking:
     """Booking entity representing a flight reservation"""
     # booking_id: unique identifier for booking lookup
     # passenger_id: reference to the passenger making the booking
     # flight_id: reference to the booked flight
-    # booking_date: when the booking was made
+    # booking_date_ns: when the booking was made, as time.time_ns() (see booking_date)
     # status: current status of the booking (confirmed/cancelled)
     booking_id: str
     passenger_id: str
     flight_id: str
-    booking_date: datetime
-    status: str = "confirmed"
+    booking_date_ns: int
+    status: BookingStatus = BookingStatus.CONFIRMED
     
     def __post_init__(self) -> None:
         # Basic null checks only in MVP
         if not self.booking_id or not self.passenger_id or not self.flight_id:
             raise ValueError("Booking ID, passenger ID, and flight ID are required")
-        if self.status not in ["confirmed", "cancelled"]:
-            raise ValueError("Status must be 'confirmed' or 'cancelled'")
+        self.booking_id = sys.intern(self.booking_id)
+        self.passenger_id = sys.intern(self.passenger_id)
+        self.flight_id = sys.intern(self.flight_id)
+        if not isinstance(self.status, BookingStatus):
+            raise ValueError("Status must be a BookingStatus")
         # Extension point: add booking_validation() post-MVP (Business Rule Pattern)
+    
+    @property
+    def booking_date(self) -> datetime:
+        """Booking time as a datetime, built on demand for display"""
+        return datetime.fromtimestamp(self.booking_date_ns / _NS_PER_SECOND)
 
 
 # ============================================================================
@@ -160,9 +249,15 @@ class Booking:
 # ============================================================================
 
 # MVP Repository Interface (only 4 methods max with targeted names)
+# Concurrency: in-memory repositories lock only save/remove, on the shard lock for the
+# entity's ID. Single dict reads and list(dict.values()) copies are atomic in CPython, so
+# find/retrieve calls skip locking and may observe the state just before or just after a
+# concurrent write.
 class BaseRepository(ABC):
     """Abstract base repository for all entities"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def save_entity_to_storage(self, entity) -> None:
         """Save entity to storage"""
@@ -182,122 +277,340 @@ class BaseRepository(ABC):
     def remove_entity_by_id(self, id: str) -> bool:
         """Remove entity by ID, return success status"""
         pass
+    
+    @abstractmethod
+    def save_entity_if_absent_from_storage(self, entity) -> bool:
+        """Save entity unless its ID is already stored, return whether it was saved.
+        Implementations must make the check and the save one atomic step"""
+        pass
+    
+    def view_all_entities_in_storage(self) -> Iterable:
+        """Iterate all entities without copying them. Defaults to the retrieved list"""
+        return self.retrieve_all_entities_from_storage()
+    
+    @abstractmethod
+    def clear_all_entities_from_storage(self) -> None:
+        """Remove every entity in one step. Not atomic with concurrent writes, so only
+        call it while the repository is idle (e.g. between tests)"""
+        pass
+    
+    def check_entities_exist_by_ids(self, ids: Iterable[str]) -> Dict[str, bool]:
+        """Check several IDs in one call, return ID -> exists"""
+        return {entity_id: self.find_entity_by_unique_id(entity_id) is not None for entity_id in ids}
 
 
 class InMemoryUserRepository(BaseRepository):
     """In-memory implementation of user repository"""
     
+    __slots__ = ("_users",)
+    
     def __init__(self) -> None:
         self._users: Dict[str, User] = {}
-        self._lock = threading.Lock()  # Thread safety for MVP
     
     def save_entity_to_storage(self, user: User) -> None:
-        with self._lock:
+        with _lock_for(user.user_id):
             self._users[user.user_id] = user
     
+    def save_entity_if_absent_from_storage(self, user: User) -> bool:
+        with _lock_for(user.user_id):
+            return self._users.setdefault(user.user_id, user) is user
+    
     def find_entity_by_unique_id(self, user_id: str) -> Optional[User]:
-        with self._lock:
-            return self._users.get(user_id)
+        return self._users.get(user_id)
     
     def retrieve_all_entities_from_storage(self) -> List[User]:
-        with self._lock:
-            return list(self._users.values())
+        return list(self._users.values())
     
-    def remove_entity_by_id(self, user_id: str) -> bool:
-        with self._lock:
-            if user_id in self._users:
-                del self._users[user_id]
-                return True
-            return False
-
-
-class InMemoryFlightRepository(BaseRepository):
-    """In-memory implementation of flight repository"""
-    
-    def __init__(self) -> None:
-        self._flights: Dict[str, Flight] = {}
-        self._lock = threading.Lock()  # Thread safety for MVP
+    def view_all_entities_in_storage(self) -> ValuesView[User]:
+        # Live view, no copy. Consume it in one C-level pass (list(), ...):
+        # Python-level loops can hit a concurrent write mid-iteration
+        return self._users.values()
     
-    def save_entity_to_storage(self, flight: Flight) -> None:
-        with self._lock:
-            self._flights[flight.flight_id] = flight
-    
-    def find_entity_by_unique_id(self, flight_id: str) -> Optional[Flight]:
-        with self._lock:
-            return self._flights.get(flight_id)
+    def clear_all_entities_from_storage(self) -> None:
+        self._users = {}
     
-    def retrieve_all_entities_from_storage(self) -> List[Flight]:
-        with self._lock:
-            return list(self._flights.values())
-    
-    def remove_entity_by_id(self, flight_id: str) -> bool:
-        with self._lock:
-            if flight_id in self._flights:
-                del self._flights[flight_id]
-                return True
-            return False
+    def remove_entity_by_id(self, user_id: str) -> bool:
+        with _lock_for(user_id):
+            return self._users.pop(user_id, _MISSING) is not _MISSING
     
-    def find_flights_by_source_and_destination(self, source: str, destination: str) -> List[Flight]:
-        """Find flights by source and destination airports"""
-        with self._lock:
-            return [
-                flight for flight in self._flights.values()
-                if flight.source.lower() == source.lower() and flight.destination.lower() == destination.lower()
-            ]
+    def check_entities_exist_by_ids(self, ids: Iterable[str]) -> Dict[str, bool]:
+        users = self._users
+        return {user_id: user_id in users for user_id in ids}
 
 
 class InMemoryPassengerRepository(BaseRepository):
     """In-memory implementation of passenger repository"""
     
+    __slots__ = ("_passengers", "_passenger_ids_by_user", "_user_index_lock")
+    
     def __init__(self) -> None:
         self._passengers: Dict[str, Passenger] = {}
-        self._lock = threading.Lock()  # Thread safety for MVP
+        # user_id -> passenger IDs; frozensets are replaced, never mutated, so lock-free
+        # readers can hold on to the set they were given
+        self._passenger_ids_by_user: Dict[str, FrozenSet[str]] = {}
+        self._user_index_lock = threading.Lock()
+    
+    def _unindex_user(self, passenger: Passenger) -> None:
+        """Drop a passenger from its user's ID set (caller holds the user index lock)"""
+        remaining = self._passenger_ids_by_user.get(passenger.user_id, frozenset()) - {passenger.passenger_id}
+        if remaining:
+            self._passenger_ids_by_user[passenger.user_id] = remaining
+        else:
+            self._passenger_ids_by_user.pop(passenger.user_id, None)
+    
+    def _reindex_user(self, previous: Optional[Passenger], passenger: Passenger) -> None:
+        """Move a saved passenger's user index entry (caller holds its shard lock)"""
+        with self._user_index_lock:
+            if previous is not None:
+                self._unindex_user(previous)
+            self._passenger_ids_by_user[passenger.user_id] = (
+                self._passenger_ids_by_user.get(passenger.user_id, frozenset()) | {passenger.passenger_id}
+            )
     
     def save_entity_to_storage(self, passenger: Passenger) -> None:
-        with self._lock:
+        with _lock_for(passenger.passenger_id):
+            previous = self._passengers.get(passenger.passenger_id)
             self._passengers[passenger.passenger_id] = passenger
+            self._reindex_user(previous, passenger)
+    
+    def save_entity_if_absent_from_storage(self, passenger: Passenger) -> bool:
+        with _lock_for(passenger.passenger_id):
+            if self._passengers.setdefault(passenger.passenger_id, passenger) is not passenger:
+                return False
+            self._reindex_user(None, passenger)
+            return True
     
     def find_entity_by_unique_id(self, passenger_id: str) -> Optional[Passenger]:
-        with self._lock:
-            return self._passengers.get(passenger_id)
+        return self._passengers.get(passenger_id)
     
     def retrieve_all_entities_from_storage(self) -> List[Passenger]:
-        with self._lock:
-            return list(self._passengers.values())
+        return list(self._passengers.values())
+    
+    def view_all_entities_in_storage(self) -> ValuesView[Passenger]:
+        # Live view, no copy; see InMemoryUserRepository.view_all_entities_in_storage
+        return self._passengers.values()
+    
+    def clear_all_entities_from_storage(self) -> None:
+        with self._user_index_lock:
+            self._passengers = {}
+            self._passenger_ids_by_user = {}
     
     def remove_entity_by_id(self, passenger_id: str) -> bool:
-        with self._lock:
-            if passenger_id in self._passengers:
-                del self._passengers[passenger_id]
-                return True
-            return False
+        with _lock_for(passenger_id):
+            passenger = self._passengers.pop(passenger_id, _MISSING)
+            if passenger is _MISSING:
+                return False
+            with self._user_index_lock:
+                self._unindex_user(passenger)
+            return True
+    
+    def check_entities_exist_by_ids(self, ids: Iterable[str]) -> Dict[str, bool]:
+        passengers = self._passengers
+        return {passenger_id: passenger_id in passengers for passenger_id in ids}
+    
+    def find_passenger_ids_by_user(self, user_id: str) -> FrozenSet[str]:
+        """Find the IDs of all passengers registered under a user"""
+        return self._passenger_ids_by_user.get(user_id, frozenset())
 
 
 class InMemoryBookingRepository(BaseRepository):
     """In-memory implementation of booking repository"""
     
+    __slots__ = ("_bookings", "_bookings_by_passenger", "_confirmed_passenger_flights", "_index_lock")
+    
     def __init__(self) -> None:
         self._bookings: Dict[str, Booking] = {}
-        self._lock = threading.Lock()  # Thread safety for MVP
+        # passenger_id -> bookings; tuples are replaced, never mutated, so lock-free
+        # readers always see a consistent bucket
+        self._bookings_by_passenger: Dict[str, Tuple[Booking, ...]] = {}
+        # (passenger_id, flight_id) of every confirmed booking, so the duplicate-booking
+        # rule is one set probe (the rule keeps at most one confirmed booking per pair)
+        self._confirmed_passenger_flights: Set[Tuple[str, str]] = set()
+        self._index_lock = threading.Lock()
+    
+    @staticmethod
+    def _discard_from_bucket(index: Dict, key, booking_id: str) -> None:
+        """Replace index[key] with its bookings minus booking_id, dropping empty buckets"""
+        remaining = tuple(b for b in index.get(key, ()) if b.booking_id != booking_id)
+        if remaining:
+            index[key] = remaining
+        else:
+            index.pop(key, None)
+    
+    def _unindex_booking(self, booking: Booking) -> None:
+        """Drop a booking from the passenger indexes (caller holds the index lock)"""
+        self._discard_from_bucket(self._bookings_by_passenger, booking.passenger_id, booking.booking_id)
+        if booking.status == BookingStatus.CONFIRMED:
+            self._confirmed_passenger_flights.discard((booking.passenger_id, booking.flight_id))
+    
+    def _reindex_booking(self, previous: Optional[Booking], booking: Booking) -> None:
+        """Move a saved booking's index entries (caller holds its shard lock)"""
+        with self._index_lock:
+            if previous is not None:
+                self._unindex_booking(previous)
+            self._bookings_by_passenger[booking.passenger_id] = (
+                self._bookings_by_passenger.get(booking.passenger_id, ()) + (booking,)
+            )
+            if booking.status == BookingStatus.CONFIRMED:
+                self._confirmed_passenger_flights.add((booking.passenger_id, booking.flight_id))
     
     def save_entity_to_storage(self, booking: Booking) -> None:
-        with self._lock:
+        with _lock_for(booking.booking_id):
+            previous = self._bookings.get(booking.booking_id)
             self._bookings[booking.booking_id] = booking
+            self._reindex_booking(previous, booking)
+    
+    def save_entity_if_absent_from_storage(self, booking: Booking) -> bool:
+        with _lock_for(booking.booking_id):
+            if self._bookings.setdefault(booking.booking_id, booking) is not booking:
+                return False
+            self._reindex_booking(None, booking)
+            return True
     
     def find_entity_by_unique_id(self, booking_id: str) -> Optional[Booking]:
-        with self._lock:
-            return self._bookings.get(booking_id)
+        return self._bookings.get(booking_id)
     
     def retrieve_all_entities_from_storage(self) -> List[Booking]:
-        with self._lock:
-            return list(self._bookings.values())
+        return list(self._bookings.values())
+    
+    def view_all_entities_in_storage(self) -> ValuesView[Booking]:
+        # Live view, no copy; see InMemoryUserRepository.view_all_entities_in_storage
+        return self._bookings.values()
+    
+    def clear_all_entities_from_storage(self) -> None:
+        with self._index_lock:
+            self._bookings = {}
+            self._bookings_by_passenger = {}
+            self._confirmed_passenger_flights = set()
     
     def remove_entity_by_id(self, booking_id: str) -> bool:
-        with self._lock:
-            if booking_id in self._bookings:
-                del self._bookings[booking_id]
-                return True
-            return False
+        with _lock_for(booking_id):
+            booking = self._bookings.pop(booking_id, _MISSING)
+            if booking is _MISSING:
+                return False
+            with self._index_lock:
+                self._unindex_booking(booking)
+            return True
+    
+    def check_entities_exist_by_ids(self, ids: Iterable[str]) -> Dict[str, bool]:
+        bookings = self._bookings
+        return {booking_id: booking_id in bookings for booking_id in ids}
+    
+    def find_bookings_by_passenger(self, passenger_id: str) -> List[Booking]:
+        """Find all bookings made for a passenger"""
+        return list(self._bookings_by_passenger.get(passenger_id, ()))
+    
+    def has_confirmed_booking(self, passenger_id: str, flight_id: str) -> bool:
+        """Check whether a passenger holds a confirmed booking on a flight"""
+        return (passenger_id, flight_id) in self._confirmed_passenger_flights
+
+
+class InMemoryFlightRepository(BaseRepository):
+    """In-memory implementation of flight repository"""
+    
+    __slots__ = ("_flights", "_flights_by_route", "_route_lock")
+    
+    def __init__(self) -> None:
+        self._flights: Dict[str, Flight] = {}
+        # Route index keyed by (source, destination) as stored; buckets are replaced,
+        # never mutated in place, so lock-free searches always see a consistent list
+        self._flights_by_route: DefaultDict[Tuple[str, str], List[Flight]] = defaultdict(list)
+        # The index is shared by every flight, so its updates take one repository-wide
+        # lock, always acquired inside the flight's shard lock
+        self._route_lock = threading.Lock()
+    
+    def _unindex_route(self, flight: Flight) -> None:
+        """Drop a flight from its route bucket (caller holds the route lock)"""
+        key = (flight.source, flight.destination)
+        remaining = [f for f in self._flights_by_route.get(key, ()) if f.flight_id != flight.flight_id]
+        if remaining:
+            self._flights_by_route[key] = remaining
+        else:
+            self._flights_by_route.pop(key, None)
+    
+    def _reindex_route(self, previous: Optional[Flight], flight: Flight) -> None:
+        """Move a saved flight's route index entry (caller holds its shard lock)"""
+        key = (flight.source, flight.destination)
+        with self._route_lock:
+            if previous is not None:
+                self._unindex_route(previous)
+            self._flights_by_route[key] = self._flights_by_route[key] + [flight]
+    
+    def save_entity_to_storage(self, flight: Flight) -> None:
+        with _lock_for(flight.flight_id):
+            previous = self._flights.get(flight.flight_id)
+            self._flights[flight.flight_id] = flight
+            self._reindex_route(previous, flight)
+    
+    def save_entity_if_absent_from_storage(self, flight: Flight) -> bool:
+        with _lock_for(flight.flight_id):
+            if self._flights.setdefault(flight.flight_id, flight) is not flight:
+                return False
+            self._reindex_route(None, flight)
+            return True
+    
+    def find_entity_by_unique_id(self, flight_id: str) -> Optional[Flight]:
+        return self._flights.get(flight_id)
+    
+    def retrieve_all_entities_from_storage(self) -> List[Flight]:
+        return list(self._flights.values())
+    
+    def view_all_entities_in_storage(self) -> ValuesView[Flight]:
+        # Live view, no copy; see InMemoryUserRepository.view_all_entities_in_storage
+        return self._flights.values()
+    
+    def clear_all_entities_from_storage(self) -> None:
+        with self._route_lock:
+            self._flights = {}
+            self._flights_by_route = defaultdict(list)
+    
+    def remove_entity_by_id(self, flight_id: str) -> bool:
+        with _lock_for(flight_id):
+            flight = self._flights.pop(flight_id, _MISSING)
+            if flight is _MISSING:
+                return False
+            with self._route_lock:
+                self._unindex_route(flight)
+            return True
+    
+    def check_entities_exist_by_ids(self, ids: Iterable[str]) -> Dict[str, bool]:
+        flights = self._flights
+        return {flight_id: flight_id in flights for flight_id in ids}
+    
+    def find_flights_by_source_and_destination(self, source: str, destination: str) -> List[Flight]:
+        """Find flights by source and destination airport codes, given upper-cased as
+        stored (FlightManager.search_flights_by_route normalizes user input)"""
+        return list(self._flights_by_route.get((source, destination), ()))
+
+
+# Design Pattern: Facade
+# Purpose: Answer existence checks spanning several repositories in one call
+# Implementation: Entity type name -> repository map, one batched check per repository
+# Trade-offs: One round-trip per repository (matters once repositories are remote)
+#             vs one more indirection for in-memory storage
+
+class RepositoryFacade:
+    """Single entry point for existence checks across entity repositories"""
+    
+    def __init__(self, repositories: Dict[str, BaseRepository]) -> None:
+        # Keys are entity type names as used in EntityNotFoundError ("Flight", ...)
+        self._repositories = repositories
+    
+    def check_entities_exist_across_repositories(
+            self, ids_by_entity_type: Dict[str, Iterable[str]]) -> Dict[str, Dict[str, bool]]:
+        """Check IDs for several entity types, return entity type -> (ID -> exists)"""
+        return {
+            entity_type: self._repositories[entity_type].check_entities_exist_by_ids(ids)
+            for entity_type, ids in ids_by_entity_type.items()
+        }
+    
+    def require_entities_to_exist(self, ids_by_entity_type: Dict[str, Iterable[str]]) -> None:
+        """Raise EntityNotFoundError for the first missing ID, in the order given"""
+        results = self.check_entities_exist_across_repositories(ids_by_entity_type)
+        for entity_type, exists_by_id in results.items():
+            for entity_id, exists in exists_by_id.items():
+                if not exists:
+                    raise EntityNotFoundError(entity_type, entity_id)
 
 
 # ============================================================================
@@ -312,21 +625,28 @@ class InMemoryBookingRepository(BaseRepository):
 class UserManager:
     """Manager for user-related operations"""
     
+    __slots__ = ("_user_repo", "_find_user", "_save_user_if_absent")
+    
     def __init__(self, user_repo: InMemoryUserRepository) -> None:
         self._user_repo = user_repo
+        # Hot repository methods bound once, so each call skips two attribute lookups
+        self._find_user = user_repo.find_entity_by_unique_id
+        self._save_user_if_absent = user_repo.save_entity_if_absent_from_storage
     
     def _validate_user_inputs(self, user_id: str, name: str, email: str) -> None:
         """Validate user input parameters"""
-        if not user_id or not user_id.strip():
+        if not _valid_id(user_id):
             raise ValidationError("user_id", "User ID cannot be empty")
-        if not name or not name.strip():
+        if not _nonblank(name):
             raise ValidationError("name", "Name cannot be empty")
-        if not email or not email.strip():
+        if not _nonblank(email):
             raise ValidationError("email", "Email cannot be empty")
         
         # Basic email validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        if email.count('@') != 1:
+            raise ValidationError("email", "Invalid email format")
+        local_part, _, domain = email.partition('@')
+        if not _EMAIL_LOCAL_RE.match(local_part) or not _EMAIL_DOMAIN_RE.match(domain):
             raise ValidationError("email", "Invalid email format")
     
     def register_new_user_in_system(self, user_id: str, name: str, email: str) -> str:
@@ -334,22 +654,18 @@ class UserManager:
         # Input validation
         self._validate_user_inputs(user_id, name, email)
         
-        # Check if user already exists
-        existing_user = self._user_repo.find_entity_by_unique_id(user_id)
-        if existing_user:
-            raise EntityAlreadyExistsError("User", user_id)
-        
-        # Create and save user
+        # Create and save user, unless the ID is already taken
         user = User(user_id=user_id, name=name, email=email)
-        self._user_repo.save_entity_to_storage(user)
+        if not self._save_user_if_absent(user):
+            raise EntityAlreadyExistsError("User", user_id)
         return user_id
     
     def retrieve_user_with_business_rules(self, user_id: str) -> Optional[User]:
         """Retrieve user by ID with basic business rules"""
-        if not user_id or not user_id.strip():
+        if not _valid_id(user_id):
             raise ValidationError("user_id", "User ID cannot be empty")
         
-        user = self._user_repo.find_entity_by_unique_id(user_id)
+        user = self._find_user(user_id)
         if not user:
             raise EntityNotFoundError("User", user_id)
         
@@ -361,28 +677,32 @@ class UserManager:
 class FlightManager:
     """Manager for flight-related operations"""
     
+    __slots__ = ("_flight_repo", "_find_flight", "_save_flight_if_absent", "_find_flights_by_route")
+    
     def __init__(self, flight_repo: InMemoryFlightRepository) -> None:
         self._flight_repo = flight_repo
+        # Hot repository methods bound once, so each call skips two attribute lookups
+        self._find_flight = flight_repo.find_entity_by_unique_id
+        self._save_flight_if_absent = flight_repo.save_entity_if_absent_from_storage
+        self._find_flights_by_route = flight_repo.find_flights_by_source_and_destination
     
     def _validate_flight_inputs(self, flight_id: str, flight_number: str, 
                                source: str, destination: str, capacity: int) -> None:
         """Validate flight input parameters"""
-        if not flight_id or not flight_id.strip():
+        if not _valid_id(flight_id):
             raise ValidationError("flight_id", "Flight ID cannot be empty")
-        if not flight_number or not flight_number.strip():
+        if not _nonblank(flight_number):
             raise ValidationError("flight_number", "Flight number cannot be empty")
-        if not source or not source.strip():
+        if not _nonblank(source):
             raise ValidationError("source", "Source airport cannot be empty")
-        if not destination or not destination.strip():
+        if not _nonblank(destination):
             raise ValidationError("destination", "Destination airport cannot be empty")
         if capacity <= 0:
             raise ValidationError("capacity", "Capacity must be positive")
         
         # Basic airport code validation (3 letters)
-        if len(source) != 3 or not source.isalpha():
-            raise ValidationError("source", "Source must be a 3-letter airport code")
-        if len(destination) != 3 or not destination.isalpha():
-            raise ValidationError("destination", "Destination must be a 3-letter airport code")
+        _validate_airport_code("source", source)
+        _validate_airport_code("destination", destination)
     
     def add_new_flight_to_system(self, flight_id: str, flight_number: str, 
                                 source: str, destination: str, capacity: int) -> str:
@@ -390,23 +710,19 @@ class FlightManager:
         # Input validation
         self._validate_flight_inputs(flight_id, flight_number, source, destination, capacity)
         
-        # Check if flight already exists
-        existing_flight = self._flight_repo.find_entity_by_unique_id(flight_id)
-        if existing_flight:
-            raise EntityAlreadyExistsError("Flight", flight_id)
-        
-        # Create and save flight
+        # Create and save flight, unless the ID is already taken
         flight = Flight(flight_id=flight_id, flight_number=flight_number,
                        source=source, destination=destination, capacity=capacity)
-        self._flight_repo.save_entity_to_storage(flight)
+        if not self._save_flight_if_absent(flight):
+            raise EntityAlreadyExistsError("Flight", flight_id)
         return flight_id
     
     def retrieve_flight_with_business_rules(self, flight_id: str) -> Optional[Flight]:
         """Retrieve flight by ID with basic business rules"""
-        if not flight_id or not flight_id.strip():
+        if not _valid_id(flight_id):
             raise ValidationError("flight_id", "Flight ID cannot be empty")
         
-        flight = self._flight_repo.find_entity_by_unique_id(flight_id)
+        flight = self._find_flight(flight_id)
         if not flight:
             raise EntityNotFoundError("Flight", flight_id)
         
@@ -419,35 +735,42 @@ class FlightManager:
     def search_flights_by_route(self, source: str, destination: str) -> List[Flight]:
         """Search flights by source and destination route"""
         # Input validation
-        if not source or not source.strip():
+        if not _nonblank(source):
             raise ValidationError("source", "Source airport cannot be empty")
-        if not destination or not destination.strip():
+        if not _nonblank(destination):
             raise ValidationError("destination", "Destination airport cannot be empty")
+        source = _validate_airport_code("source", source)
+        destination = _validate_airport_code("destination", destination)
         
         # Pattern: Specification Pattern (extension point for complex queries)
-        return self._flight_repo.find_flights_by_source_and_destination(source, destination)
+        return self._find_flights_by_route(source, destination)
 
 
 class PassengerManager:
     """Manager for passenger-related operations"""
     
+    __slots__ = ("_passenger_repo", "_find_passenger", "_save_passenger_if_absent")
+    
     def __init__(self, passenger_repo: InMemoryPassengerRepository) -> None:
         self._passenger_repo = passenger_repo
+        # Hot repository methods bound once, so each call skips two attribute lookups
+        self._find_passenger = passenger_repo.find_entity_by_unique_id
+        self._save_passenger_if_absent = passenger_repo.save_entity_if_absent_from_storage
     
     def _validate_passenger_inputs(self, passenger_id: str, user_id: str, 
                                   name: str, passport_number: str) -> None:
         """Validate passenger input parameters"""
-        if not passenger_id or not passenger_id.strip():
+        if not _valid_id(passenger_id):
             raise ValidationError("passenger_id", "Passenger ID cannot be empty")
-        if not user_id or not user_id.strip():
+        if not _valid_id(user_id):
             raise ValidationError("user_id", "User ID cannot be empty")
-        if not name or not name.strip():
+        if not _nonblank(name):
             raise ValidationError("name", "Passenger name cannot be empty")
-        if not passport_number or not passport_number.strip():
+        if not _nonblank(passport_number):
             raise ValidationError("passport_number", "Passport number cannot be empty")
         
         # Basic passport number validation (alphanumeric, 6-9 characters)
-        if not re.match(r'^[A-Z0-9]{6,9}$', passport_number):
+        if not (6 <= len(passport_number) <= 9 and _PASSPORT_CHARS.issuperset(passport_number)):
             raise ValidationError("passport_number", "Passport number must be 6-9 alphanumeric characters")
     
     def register_new_passenger_for_user(self, passenger_id: str, user_id: str, 
@@ -456,23 +779,19 @@ class PassengerManager:
         # Input validation
         self._validate_passenger_inputs(passenger_id, user_id, name, passport_number)
         
-        # Check if passenger already exists
-        existing_passenger = self._passenger_repo.find_entity_by_unique_id(passenger_id)
-        if existing_passenger:
-            raise EntityAlreadyExistsError("Passenger", passenger_id)
-        
-        # Create and save passenger
+        # Create and save passenger, unless the ID is already taken
         passenger = Passenger(passenger_id=passenger_id, user_id=user_id,
                              name=name, passport_number=passport_number)
-        self._passenger_repo.save_entity_to_storage(passenger)
+        if not self._save_passenger_if_absent(passenger):
+            raise EntityAlreadyExistsError("Passenger", passenger_id)
         return passenger_id
     
     def retrieve_passenger_with_business_rules(self, passenger_id: str) -> Optional[Passenger]:
         """Retrieve passenger by ID with basic business rules"""
-        if not passenger_id or not passenger_id.strip():
+        if not _valid_id(passenger_id):
             raise ValidationError("passenger_id", "Passenger ID cannot be empty")
         
-        passenger = self._passenger_repo.find_entity_by_unique_id(passenger_id)
+        passenger = self._find_passenger(passenger_id)
         if not passenger:
             raise EntityNotFoundError("Passenger", passenger_id)
         
@@ -482,39 +801,40 @@ class PassengerManager:
 class BookingManager:
     """Manager for booking-related operations"""
     
+    __slots__ = ("_booking_repo", "_passenger_repo", "_flight_repo", "_require_entities_to_exist",
+                 "_has_confirmed_booking", "_save_booking_if_absent", "_find_booking")
+    
     def __init__(self, booking_repo: InMemoryBookingRepository,
                  passenger_repo: InMemoryPassengerRepository,
                  flight_repo: InMemoryFlightRepository) -> None:
         self._booking_repo = booking_repo
         self._passenger_repo = passenger_repo
         self._flight_repo = flight_repo
+        # Hot repository methods bound once, so each call skips two attribute lookups
+        self._require_entities_to_exist = RepositoryFacade(
+            {"Passenger": passenger_repo, "Flight": flight_repo}
+        ).require_entities_to_exist
+        self._has_confirmed_booking = booking_repo.has_confirmed_booking
+        self._save_booking_if_absent = booking_repo.save_entity_if_absent_from_storage
+        self._find_booking = booking_repo.find_entity_by_unique_id
     
     def _validate_booking_inputs(self, booking_id: str, passenger_id: str, flight_id: str) -> None:
         """Validate booking input parameters"""
-        if not booking_id or not booking_id.strip():
+        if not _valid_id(booking_id):
             raise ValidationError("booking_id", "Booking ID cannot be empty")
-        if not passenger_id or not passenger_id.strip():
+        if not _valid_id(passenger_id):
             raise ValidationError("passenger_id", "Passenger ID cannot be empty")
-        if not flight_id or not flight_id.strip():
+        if not _valid_id(flight_id):
             raise ValidationError("flight_id", "Flight ID cannot be empty")
     
     def _validate_booking_business_rules(self, passenger_id: str, flight_id: str) -> None:
         """Validate booking business rules"""
-        # Check if passenger exists
-        passenger = self._passenger_repo.find_entity_by_unique_id(passenger_id)
-        if not passenger:
-            raise EntityNotFoundError("Passenger", passenger_id)
-        
-        # Check if flight exists
-        flight = self._flight_repo.find_entity_by_unique_id(flight_id)
-        if not flight:
-            raise EntityNotFoundError("Flight", flight_id)
+        # Check that passenger and flight exist, in one batched call
+        self._require_entities_to_exist({"Passenger": [passenger_id], "Flight": [flight_id]})
         
         # Check if passenger already has a booking for this flight
-        existing_bookings = self.get_all_bookings_for_passenger(passenger_id)
-        for booking in existing_bookings:
-            if booking.flight_id == flight_id and booking.status == "confirmed":
-                raise InvalidBookingError(f"Passenger {passenger_id} already has a confirmed booking for flight {flight_id}")
+        if self._has_confirmed_booking(passenger_id, flight_id):
+            raise InvalidBookingError(f"Passenger {passenger_id} already has a confirmed booking for flight {flight_id}")
     
     def create_new_booking_for_passenger(self, booking_id: str, passenger_id: str, 
                                         flight_id: str) -> str:
@@ -522,26 +842,22 @@ class BookingManager:
         # Input validation
         self._validate_booking_inputs(booking_id, passenger_id, flight_id)
         
-        # Check if booking already exists
-        existing_booking = self._booking_repo.find_entity_by_unique_id(booking_id)
-        if existing_booking:
-            raise EntityAlreadyExistsError("Booking", booking_id)
-        
         # Business rule validation
         self._validate_booking_business_rules(passenger_id, flight_id)
         
-        # Create and save booking
+        # Create and save booking, unless the ID is already taken
         booking = Booking(booking_id=booking_id, passenger_id=passenger_id,
-                         flight_id=flight_id, booking_date=datetime.now())
-        self._booking_repo.save_entity_to_storage(booking)
+                         flight_id=flight_id, booking_date_ns=time.time_ns())
+        if not self._save_booking_if_absent(booking):
+            raise EntityAlreadyExistsError("Booking", booking_id)
         return booking_id
     
     def retrieve_booking_with_business_rules(self, booking_id: str) -> Optional[Booking]:
         """Retrieve booking by ID with basic business rules"""
-        if not booking_id or not booking_id.strip():
+        if not _valid_id(booking_id):
             raise ValidationError("booking_id", "Booking ID cannot be empty")
         
-        booking = self._booking_repo.find_entity_by_unique_id(booking_id)
+        booking = self._find_booking(booking_id)
         if not booking:
             raise EntityNotFoundError("Booking", booking_id)
         
@@ -549,27 +865,29 @@ class BookingManager:
     
     def get_all_bookings_for_passenger(self, passenger_id: str) -> List[Booking]:
         """Get all bookings for a specific passenger"""
-        if not passenger_id or not passenger_id.strip():
+        if not _valid_id(passenger_id):
             raise ValidationError("passenger_id", "Passenger ID cannot be empty")
         
-        all_bookings = self._booking_repo.retrieve_all_entities_from_storage()
-        return [booking for booking in all_bookings if booking.passenger_id == passenger_id]
+        return self._booking_repo.find_bookings_by_passenger(passenger_id)
     
     def get_all_bookings_for_user(self, user_id: str) -> List[Booking]:
-        """Get all bookings for a specific user (across all their passengers)"""
-        if not user_id or not user_id.strip():
+        """Get all bookings for a specific user (across all their passengers), in booking order"""
+        if not _valid_id(user_id):
             raise ValidationError("user_id", "User ID cannot be empty")
         
         # Get all passengers for this user
-        all_passengers = self._passenger_repo.retrieve_all_entities_from_storage()
-        user_passenger_ids = [p.passenger_id for p in all_passengers if p.user_id == user_id]
+        user_passenger_ids = self._passenger_repo.find_passenger_ids_by_user(user_id)
         
         if not user_passenger_ids:
             return []  # User has no passengers
         
-        # Get all bookings for these passengers
-        all_bookings = self._booking_repo.retrieve_all_entities_from_storage()
-        return [booking for booking in all_bookings if booking.passenger_id in user_passenger_ids]
+        # Get all bookings for these passengers from the per-passenger index, then
+        # interleave them back into the order they were booked
+        user_bookings: List[Booking] = []
+        for passenger_id in user_passenger_ids:
+            user_bookings.extend(self._booking_repo.find_bookings_by_passenger(passenger_id))
+        user_bookings.sort(key=lambda booking: booking.booking_date_ns)
+        return user_bookings
 
 
 # ============================================================================
@@ -594,20 +912,29 @@ class FlightReservationSystem:
     
     def demonstrate_complete_user_journey(self) -> None:
         """Demonstrate a complete user journey from registration to booking"""
-        print("=== Flight Reservation System - MVP Demo ===")
+        # Collect the demo's output lines and print them once, even if a step raises
+        lines: List[str] = []
+        try:
+            self._run_user_journey(lines)
+        finally:
+            print("\n".join(lines))
+    
+    def _run_user_journey(self, lines: List[str]) -> None:
+        """Run the demo steps, appending progress lines to lines"""
+        lines.append("=== Flight Reservation System - MVP Demo ===")
         
         # Step 1: Register a user
-        print("\n1. Registering a new user...")
+        lines.append("\n1. Registering a new user...")
         try:
             user_id = self.user_manager.register_new_user_in_system(
                 user_id="U001", name="John Doe", email="john@example.com"
             )
-            print(f"   User registered with ID: {user_id}")
+            lines.append(f"   User registered with ID: {user_id}")
         except Exception as e:
-            print(f"   Error: {e}")
+            lines.append(f"   Error: {e}")
         
         # Step 2: Add flights
-        print("\n2. Adding flights to the system...")
+        lines.append("\n2. Adding flights to the system...")
         try:
             flight_id1 = self.flight_manager.add_new_flight_to_system(
                 flight_id="F001", flight_number="AA123", 
@@ -621,22 +948,22 @@ class FlightReservationSystem:
                 flight_id="F003", flight_number="DL789", 
                 source="JFK", destination="ORD", capacity=180
             )
-            print(f"   Flights added: {flight_id1}, {flight_id2}, {flight_id3}")
+            lines.append(f"   Flights added: {flight_id1}, {flight_id2}, {flight_id3}")
         except Exception as e:
-            print(f"   Error: {e}")
+            lines.append(f"   Error: {e}")
         
         # Step 3: Search for flights
-        print("\n3. Searching for flights from JFK to LAX...")
+        lines.append("\n3. Searching for flights from JFK to LAX...")
         try:
             search_results = self.flight_manager.search_flights_by_route("JFK", "LAX")
-            print(f"   Found {len(search_results)} flights:")
+            lines.append(f"   Found {len(search_results)} flights:")
             for flight in search_results:
-                print(f"     Flight {flight.flight_number}: {flight.source} → {flight.destination} (Capacity: {flight.capacity})")
+                lines.append(f"     Flight {flight.flight_number}: {flight.source} → {flight.destination} (Capacity: {flight.capacity})")
         except Exception as e:
-            print(f"   Error: {e}")
+            lines.append(f"   Error: {e}")
         
         # Step 4: Register passengers for the user
-        print("\n4. Registering passengers...")
+        lines.append("\n4. Registering passengers...")
         try:
             passenger_id1 = self.passenger_manager.register_new_passenger_for_user(
                 passenger_id="P001", user_id="U001", 
@@ -646,12 +973,12 @@ class FlightReservationSystem:
                 passenger_id="P002", user_id="U001", 
                 name="Jane Doe", passport_number="US789012"
             )
-            print(f"   Passengers registered with IDs: {passenger_id1}, {passenger_id2}")
+            lines.append(f"   Passengers registered with IDs: {passenger_id1}, {passenger_id2}")
         except Exception as e:
-            print(f"   Error: {e}")
+            lines.append(f"   Error: {e}")
         
         # Step 5: Create bookings
-        print("\n5. Creating bookings...")
+        lines.append("\n5. Creating bookings...")
         try:
             booking_id1 = self.booking_manager.create_new_booking_for_passenger(
                 booking_id="B001", passenger_id="P001", flight_id="F001"
@@ -659,44 +986,44 @@ class FlightReservationSystem:
             booking_id2 = self.booking_manager.create_new_booking_for_passenger(
                 booking_id="B002", passenger_id="P002", flight_id="F002"
             )
-            print(f"   Bookings created with IDs: {booking_id1}, {booking_id2}")
+            lines.append(f"   Bookings created with IDs: {booking_id1}, {booking_id2}")
         except Exception as e:
-            print(f"   Error: {e}")
+            lines.append(f"   Error: {e}")
         
         # Step 6: View bookings for individual passengers
-        print("\n6. Viewing bookings for individual passengers...")
+        lines.append("\n6. Viewing bookings for individual passengers...")
         try:
             bookings_p1 = self.booking_manager.get_all_bookings_for_passenger("P001")
-            print(f"   Passenger P001 has {len(bookings_p1)} bookings:")
+            lines.append(f"   Passenger P001 has {len(bookings_p1)} bookings:")
             for booking in bookings_p1:
                 flight = self.flight_manager.retrieve_flight_with_business_rules(booking.flight_id)
-                print(f"     Booking {booking.booking_id}: Flight {flight.flight_number} "
+                lines.append(f"     Booking {booking.booking_id}: Flight {flight.flight_number} "
                       f"({flight.source} → {flight.destination}) - Status: {booking.status}")
             
             bookings_p2 = self.booking_manager.get_all_bookings_for_passenger("P002")
-            print(f"   Passenger P002 has {len(bookings_p2)} bookings:")
+            lines.append(f"   Passenger P002 has {len(bookings_p2)} bookings:")
             for booking in bookings_p2:
                 flight = self.flight_manager.retrieve_flight_with_business_rules(booking.flight_id)
-                print(f"     Booking {booking.booking_id}: Flight {flight.flight_number} "
+                lines.append(f"     Booking {booking.booking_id}: Flight {flight.flight_number} "
                       f"({flight.source} → {flight.destination}) - Status: {booking.status}")
         except Exception as e:
-            print(f"   Error: {e}")
+            lines.append(f"   Error: {e}")
         
         # Step 7: View all bookings for the user
-        print("\n7. Viewing all bookings for user...")
+        lines.append("\n7. Viewing all bookings for user...")
         try:
             user_bookings = self.booking_manager.get_all_bookings_for_user("U001")
-            print(f"   User U001 has {len(user_bookings)} total bookings:")
+            lines.append(f"   User U001 has {len(user_bookings)} total bookings:")
             for booking in user_bookings:
                 flight = self.flight_manager.retrieve_flight_with_business_rules(booking.flight_id)
                 passenger = self.passenger_manager.retrieve_passenger_with_business_rules(booking.passenger_id)
-                print(f"     Booking {booking.booking_id}: {passenger.name} on Flight {flight.flight_number} "
+                lines.append(f"     Booking {booking.booking_id}: {passenger.name} on Flight {flight.flight_number} "
                       f"({flight.source} → {flight.destination}) - Status: {booking.status}")
         except Exception as e:
-            print(f"   Error: {e}")
+            lines.append(f"   Error: {e}")
         
         # Step 8: Demonstrate error handling
-        print("\n8. Demonstrating error handling...")
+        lines.append("\n8. Demonstrating error handling...")
         
         # Try to register duplicate user
         try:
@@ -704,7 +1031,7 @@ class FlightReservationSystem:
                 user_id="U001", name="John Doe", email="john@example.com"
             )
         except Exception as e:
-            print(f"   Expected error (duplicate user): {e}")
+            lines.append(f"   Expected error (duplicate user): {e}")
         
         # Try to create booking with invalid passenger
         try:
@@ -712,15 +1039,15 @@ class FlightReservationSystem:
                 booking_id="B002", passenger_id="P999", flight_id="F001"
             )
         except Exception as e:
-            print(f"   Expected error (invalid passenger): {e}")
+            lines.append(f"   Expected error (invalid passenger): {e}")
         
         # Try to search with invalid airport code
         try:
             self.flight_manager.search_flights_by_route("", "LAX")
         except Exception as e:
-            print(f"   Expected error (invalid source): {e}")
+            lines.append(f"   Expected error (invalid source): {e}")
         
-        print("\n=== Demo Complete ===")
+        lines.append("\n=== Demo Complete ===")
 
 
 # ============================================================================
@@ -13,12 +13,13 @@ Focus on 3-4 most crucial MVP functions:
 4. Error handling (validation and business rules)
 """
 
+import time
 import unittest
 from datetime import datetime
 from typing import List
 
 from main import (
-    User, Flight, Passenger, Booking,
+    User, Flight, Passenger, Booking, BookingStatus,
     InMemoryUserRepository, InMemoryFlightRepository, 
     InMemoryPassengerRepository, InMemoryBookingRepository,
     UserManager, FlightManager, PassengerManager, BookingManager
@@ -32,26 +33,27 @@ from exceptions import (
 class TestFlightReservationMVP(unittest.TestCase):
     """Test suite for Flight Reservation System MVP core functions"""
     
-    def setUp(self) -> None:
-        """Set up test fixtures before each test method"""
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build the repository and manager stack once for the whole suite"""
         # Initialize repositories
-        self.user_repo = InMemoryUserRepository()
-        self.flight_repo = InMemoryFlightRepository()
-        self.passenger_repo = InMemoryPassengerRepository()
-        self.booking_repo = InMemoryBookingRepository()
+        cls.user_repo = InMemoryUserRepository()
+        cls.flight_repo = InMemoryFlightRepository()
+        cls.passenger_repo = InMemoryPassengerRepository()
+        cls.booking_repo = InMemoryBookingRepository()
         
         # Initialize managers
-        self.user_manager = UserManager(self.user_repo)
-        self.flight_manager = FlightManager(self.flight_repo)
-        self.passenger_manager = PassengerManager(self.passenger_repo)
-        self.booking_manager = BookingManager(
-            self.booking_repo, self.passenger_repo, self.flight_repo
+        cls.user_manager = UserManager(cls.user_repo)
+        cls.flight_manager = FlightManager(cls.flight_repo)
+        cls.passenger_manager = PassengerManager(cls.passenger_repo)
+        cls.booking_manager = BookingManager(
+            cls.booking_repo, cls.passenger_repo, cls.flight_repo
         )
     
     def tearDown(self) -> None:
-        """Clean up after each test method"""
-        # Repositories are in-memory, so no cleanup needed
-        pass
+        """Empty the shared repositories so every test starts from a clean slate"""
+        for repo in (self.user_repo, self.flight_repo, self.passenger_repo, self.booking_repo):
+            repo.clear_all_entities_from_storage()
     
     def test_user_registration_success(self) -> None:
         """Test successful user registration - core entity creation"""
@@ -102,7 +104,7 @@ class TestFlightReservationMVP(unittest.TestCase):
         self.assertIsNotNone(booking)
         self.assertEqual(booking.passenger_id, passenger_id)
         self.assertEqual(booking.flight_id, flight_id)
-        self.assertEqual(booking.status, "confirmed")
+        self.assertEqual(booking.status, BookingStatus.CONFIRMED)
     
     def test_flight_search_functionality(self) -> None:
         """Test flight search by route - core query functionality"""
@@ -121,6 +123,20 @@ class TestFlightReservationMVP(unittest.TestCase):
         self.assertIn("UA456", flight_numbers)
         self.assertNotIn("DL789", flight_numbers)  # Different route
     
+    def test_flight_search_route_index(self) -> None:
+        """Test route search ignores case and follows flight removal"""
+        # Arrange
+        self.flight_manager.add_new_flight_to_system("F001", "AA123", "jfk", "lax", 150)
+        self.flight_manager.add_new_flight_to_system("F002", "UA456", "JFK", "LAX", 200)
+        
+        # Act
+        self.flight_repo.remove_entity_by_id("F001")
+        search_results = self.flight_manager.search_flights_by_route("Jfk", "Lax")
+        
+        # Assert
+        self.assertEqual([flight.flight_id for flight in search_results], ["F002"])
+        self.assertEqual(self.flight_manager.search_flights_by_route("JFK", "ORD"), [])
+    
     def test_booking_with_invalid_passenger_error(self) -> None:
         """Test booking with non-existent passenger - business rule validation"""
         # Arrange - Create flight but no passenger
@@ -132,6 +148,21 @@ class TestFlightReservationMVP(unittest.TestCase):
         
         self.assertIn("Passenger with ID 'P999' not found", str(context.exception))
     
+    def test_booking_rules_checked_before_booking_id(self) -> None:
+        """Test a missing passenger is reported before a taken booking ID - error precedence"""
+        # Arrange - Book B001, then reuse its ID for a passenger that does not exist
+        self.user_manager.register_new_user_in_system("U001", "John Doe", "john@example.com")
+        flight_id = self.flight_manager.add_new_flight_to_system("F001", "AA123", "JFK", "LAX", 150)
+        passenger_id = self.passenger_manager.register_new_passenger_for_user("P001", "U001", "John Doe", "US123456")
+        self.booking_manager.create_new_booking_for_passenger("B001", passenger_id, flight_id)
+        
+        # Act & Assert - The business rules run before the atomic save
+        with self.assertRaises(EntityNotFoundError) as context:
+            self.booking_manager.create_new_booking_for_passenger("B001", "P999", flight_id)
+        
+        self.assertIn("Passenger with ID 'P999' not found", str(context.exception))
+        self.assertEqual(self.booking_repo.find_entity_by_unique_id("B001").passenger_id, passenger_id)
+    
     def test_duplicate_booking_prevention(self) -> None:
         """Test prevention of duplicate bookings - business rule validation"""
         # Arrange - Create booking
@@ -179,6 +210,39 @@ class TestFlightReservationMVP(unittest.TestCase):
         booking_ids = [booking.booking_id for booking in user_bookings]
         self.assertIn("B001", booking_ids)
         self.assertIn("B002", booking_ids)
+    
+    def test_get_all_bookings_for_user_in_booking_order(self) -> None:
+        """Test a user's bookings across passengers come back in the order they were made"""
+        # Arrange - Alternate bookings between two passengers of one user
+        self.user_manager.register_new_user_in_system("U001", "John Doe", "john@example.com")
+        for flight_id, flight_number in (("F001", "AA123"), ("F002", "UA456"), ("F003", "DL789")):
+            self.flight_manager.add_new_flight_to_system(flight_id, flight_number, "JFK", "LAX", 150)
+        self.passenger_manager.register_new_passenger_for_user("P002", "U001", "Jane Doe", "US789012")
+        self.passenger_manager.register_new_passenger_for_user("P001", "U001", "John Doe", "US123456")
+        
+        self.booking_manager.create_new_booking_for_passenger("B001", "P002", "F001")
+        self.booking_manager.create_new_booking_for_passenger("B002", "P001", "F002")
+        self.booking_manager.create_new_booking_for_passenger("B003", "P002", "F003")
+        
+        # Act
+        user_bookings = self.booking_manager.get_all_bookings_for_user("U001")
+        
+        # Assert
+        self.assertEqual([booking.booking_id for booking in user_bookings], ["B001", "B002", "B003"])
+    
+    def test_entities_are_slotted(self) -> None:
+        """Test entities carry no per-instance __dict__ - memory footprint guard"""
+        # Arrange
+        entities = [
+            User("U001", "John Doe", "john@example.com"),
+            Flight("F001", "AA123", "JFK", "LAX", 150),
+            Passenger("P001", "U001", "John Doe", "US123456"),
+            Booking("B001", "P001", "F001", time.time_ns()),
+        ]
+        
+        # Assert
+        for entity in entities:
+            self.assertFalse(hasattr(entity, "__dict__"), type(entity).__name__)
 
 
 def run_mvp_tests() -> None:
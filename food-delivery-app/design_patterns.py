@@ -1,15 +1,11 @@
 """
 Design patterns for the food delivery app.
 """
+import importlib
+import random
 from abc import ABC, abstractmethod
-from typing import Dict, Type
+from typing import Dict, Tuple, Type, Union
 from repositories.base_repository import BaseRepository
-from repositories.in_memory.user_repo import InMemoryUserRepository
-from repositories.in_memory.restaurant_repo import InMemoryRestaurantRepository
-from repositories.in_memory.dish_repo import InMemoryDishRepository
-from repositories.in_memory.cart_repo import InMemoryCartRepository
-from repositories.in_memory.order_repo import InMemoryOrderRepository
-from repositories.in_memory.payment_repo import InMemoryPaymentRepository
 from entities.user import User
 from entities.restaurant import Restaurant
 from entities.dish import Dish
@@ -17,26 +13,48 @@ from entities.cart import Cart
 from entities.order import Order
 from entities.payment import Payment
 
+# Bound once so the simulated gateways skip the module attribute lookups per payment
+_rand = random.random
+_randint = random.randint
+
+# Entity type -> (module, class) of its default repository. Modules are imported on first
+# use, so processes that only need payment strategies never load the repositories
+_DEFAULT_REPOSITORIES: Dict[Type, Tuple[str, str]] = {
+    User: ("repositories.in_memory.user_repo", "InMemoryUserRepository"),
+    Restaurant: ("repositories.in_memory.restaurant_repo", "InMemoryRestaurantRepository"),
+    Dish: ("repositories.in_memory.dish_repo", "InMemoryDishRepository"),
+    Cart: ("repositories.in_memory.cart_repo", "InMemoryCartRepository"),
+    Order: ("repositories.in_memory.order_repo", "InMemoryOrderRepository"),
+    Payment: ("repositories.in_memory.payment_repo", "InMemoryPaymentRepository"),
+}
+
 
 class RepositoryFactory:
     """Factory pattern for creating repository instances."""
     
-    _repositories: Dict[Type, Type[BaseRepository]] = {
-        User: InMemoryUserRepository,
-        Restaurant: InMemoryRestaurantRepository,
-        Dish: InMemoryDishRepository,
-        Cart: InMemoryCartRepository,
-        Order: InMemoryOrderRepository,
-        Payment: InMemoryPaymentRepository,
-    }
+    # Registered and already-resolved default repository classes
+    _repositories: Dict[Type, Type[BaseRepository]] = {}
     
     @classmethod
     def create_repository(cls, entity_type: Type) -> BaseRepository:
         """Create a repository instance for the given entity type."""
-        if entity_type not in cls._repositories:
+        repository_class = cls._repositories.get(entity_type)
+        if repository_class is None:
+            repository_class = cls._load_default_repository(entity_type)
+        
+        return repository_class()
+    
+    @classmethod
+    def _load_default_repository(cls, entity_type: Type) -> Type[BaseRepository]:
+        """Import the default repository class for an entity type and remember it."""
+        default = _DEFAULT_REPOSITORIES.get(entity_type)
+        if default is None:
             raise ValueError(f"No repository found for entity type: {entity_type}")
         
-        return cls._repositories[entity_type]()
+        module_name, class_name = default
+        repository_class = getattr(importlib.import_module(module_name), class_name)
+        # A class registered meanwhile wins over the default
+        return cls._repositories.setdefault(entity_type, repository_class)
     
     @classmethod
     def register_repository(cls, entity_type: Type, repository_class: Type[BaseRepository]) -> None:
@@ -61,12 +79,14 @@ class PaymentStrategy(ABC):
 class CreditCardStrategy(PaymentStrategy):
     """Credit card payment strategy."""
     
+    _PREFIX = "cc_txn_"
+    _FAILURE_RATE = 0.05  # 95% success rate
+    
     def process_payment(self, amount: float, user_id: str, order_id: str) -> tuple[bool, str, str]:
         """Process credit card payment."""
         # Simulate credit card processing
-        import random
-        success = random.random() > 0.05  # 95% success rate
-        transaction_id = f"cc_txn_{order_id}_{random.randint(1000, 9999)}"
+        success = _rand() > self._FAILURE_RATE
+        transaction_id = self._PREFIX + order_id + "_" + str(_randint(1000, 9999))
         message = "Credit card payment processed successfully" if success else "Credit card payment failed"
         return success, transaction_id, message
     
@@ -78,12 +98,14 @@ class CreditCardStrategy(PaymentStrategy):
 class DigitalWalletStrategy(PaymentStrategy):
     """Digital wallet payment strategy."""
     
+    _PREFIX = "dw_txn_"
+    _FAILURE_RATE = 0.02  # 98% success rate
+    
     def process_payment(self, amount: float, user_id: str, order_id: str) -> tuple[bool, str, str]:
         """Process digital wallet payment."""
         # Simulate digital wallet processing
-        import random
-        success = random.random() > 0.02  # 98% success rate
-        transaction_id = f"dw_txn_{order_id}_{random.randint(1000, 9999)}"
+        success = _rand() > self._FAILURE_RATE
+        transaction_id = self._PREFIX + order_id + "_" + str(_randint(1000, 9999))
         message = "Digital wallet payment processed successfully" if success else "Digital wallet payment failed"
         return success, transaction_id, message
     
@@ -108,23 +130,26 @@ class CashOnDeliveryStrategy(PaymentStrategy):
 
 
 class PaymentStrategyFactory:
-    """Factory for creating payment strategies."""
+    """Factory for payment strategies. Strategies are stateless, so one shared instance per method is handed out."""
     
-    _strategies = {
-        "credit_card": CreditCardStrategy,
-        "digital_wallet": DigitalWalletStrategy,
-        "cash_on_delivery": CashOnDeliveryStrategy,
+    _strategies: Dict[str, PaymentStrategy] = {
+        "credit_card": CreditCardStrategy(),
+        "digital_wallet": DigitalWalletStrategy(),
+        "cash_on_delivery": CashOnDeliveryStrategy(),
     }
     
     @classmethod
     def create_strategy(cls, payment_method: str) -> PaymentStrategy:
-        """Create a payment strategy for the given method."""
-        if payment_method not in cls._strategies:
-            raise ValueError(f"Unknown payment method: {payment_method}")
-        
-        return cls._strategies[payment_method]()
+        """Get the payment strategy for the given method."""
+        try:
+            return cls._strategies[payment_method]
+        except KeyError:
+            raise ValueError(f"Unknown payment method: {payment_method}") from None
     
     @classmethod
-    def register_strategy(cls, method: str, strategy_class: Type[PaymentStrategy]) -> None:
-        """Register a new payment strategy."""
-        cls._strategies[method] = strategy_class
+    def register_strategy(cls, method: str,
+                          strategy: Union[PaymentStrategy, Type[PaymentStrategy]]) -> None:
+        """Register a new payment strategy, given as an instance or a class to instantiate once."""
+        if isinstance(strategy, type):
+            strategy = strategy()
+        cls._strategies[method] = strategy
@@ -1,42 +1,47 @@
 """
 Cart entity for the food delivery app.
 """
+import sys
 from typing import Dict, List
 
 
 class CartItem:
     # dish_id: references the dish being added to cart
     # quantity: number of items of this dish
+    __slots__ = ("dish_id", "quantity")
+
     def __init__(self, dish_id: str, quantity: int):
-        self.dish_id = dish_id
+        self.dish_id = sys.intern(dish_id)
         self.quantity = quantity
 
 
 class Cart:
     # id: unique identifier for the cart across the system
     # user_id: links cart to its owner
-    # items: list of cart items with quantities
+    # items: dish_id -> quantity, in the order dishes were first added
     # restaurant_id: ensures all items are from same restaurant
+    __slots__ = ("id", "user_id", "restaurant_id", "items")
+
     def __init__(self, id: str, user_id: str, restaurant_id: str = None):
-        self.id = id
-        self.user_id = user_id
+        self.id = sys.intern(id)
+        self.user_id = sys.intern(user_id)
         self.restaurant_id = restaurant_id
-        self.items: List[CartItem] = []
+        self.items: Dict[str, int] = {}
+
+    @property
+    def items_view(self) -> List[CartItem]:
+        """Cart contents as CartItem objects, for callers that want line items."""
+        return [CartItem(dish_id, quantity) for dish_id, quantity in self.items.items()]
 
     def add_item(self, dish_id: str, quantity: int = 1) -> None:
-        # Check if item already exists and update quantity
-        for item in self.items:
-            if item.dish_id == dish_id:
-                item.quantity += quantity
-                return
-        # Add new item
-        self.items.append(CartItem(dish_id, quantity))
+        # Adds a new line or bumps the quantity of an existing one
+        self.items[dish_id] = self.items.get(dish_id, 0) + quantity
 
     def remove_item(self, dish_id: str) -> None:
-        self.items = [item for item in self.items if item.dish_id != dish_id]
+        self.items.pop(dish_id, None)
 
     def get_total_items(self) -> int:
-        return sum(item.quantity for item in self.items)
+        return sum(self.items.values())
 
     def __str__(self) -> str:
         return f"Cart(id={self.id}, user_id={self.user_id}, items_count={len(self.items)})"
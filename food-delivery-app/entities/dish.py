@@ -1,6 +1,7 @@
 """
 Dish entity for the food delivery app.
 """
+import sys
 from typing import Optional
 from validators import Validators
 from errors import ValidationError
@@ -13,6 +14,8 @@ class Dish:
     # restaurant_id: links dish to its restaurant
     # description: details about the dish for user information
     # is_available: prevents adding to cart when False
+    __slots__ = ("id", "name", "price", "restaurant_id", "description", "is_available")
+
     def __init__(self, id: str, name: str, price: float, restaurant_id: str, description: str = "", is_available: bool = True):
         # Validate inputs
         Validators.validate_id_format(id, "Dish")
@@ -20,10 +23,10 @@ class Dish:
         Validators.validate_price(price)
         Validators.validate_id_format(restaurant_id, "Restaurant")
         
-        self.id = id
+        self.id = sys.intern(id)
         self.name = name
         self.price = price
-        self.restaurant_id = restaurant_id
+        self.restaurant_id = sys.intern(restaurant_id)
         self.description = description
         self.is_available = is_available
 
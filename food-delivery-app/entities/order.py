@@ -1,11 +1,12 @@
 """
 Order entity for the food delivery app.
 """
+import sys
 from typing import List, Dict
 from enum import Enum
 
 
-class OrderStatus(Enum):
+class OrderStatus(str, Enum):
     PENDING = "pending"
     CONFIRMED = "confirmed"
     PREPARING = "preparing"
@@ -14,14 +15,21 @@ class OrderStatus(Enum):
     CANCELLED = "cancelled"
 
 
+def to_cents(amount: float) -> int:
+    """Convert a currency amount to whole cents, rounding to the nearest cent."""
+    return int(round(amount * 100))
+
+
 class OrderItem:
     # dish_id: references the dish in the order
     # quantity: number of items of this dish
-    # price: price per item at time of order
-    def __init__(self, dish_id: str, quantity: int, price: float):
-        self.dish_id = dish_id
+    # price_cents: price per item at time of order, in whole cents
+    __slots__ = ("dish_id", "quantity", "price_cents")
+
+    def __init__(self, dish_id: str, quantity: int, price_cents: int):
+        self.dish_id = sys.intern(dish_id)
         self.quantity = quantity
-        self.price = price
+        self.price_cents = price_cents
 
 
 class Order:
@@ -30,20 +38,28 @@ class Order:
     # restaurant_id: restaurant fulfilling the order
     # items: list of order items with quantities and prices
     # status: current state of the order
-    # total_amount: total cost of the order
+    # total_cents: total cost of the order in whole cents, summed exactly as items are added
     # delivery_address: where to deliver the order
+    __slots__ = ("id", "user_id", "restaurant_id", "delivery_address", "items", "status", "total_cents")
+
     def __init__(self, id: str, user_id: str, restaurant_id: str, delivery_address: str):
-        self.id = id
-        self.user_id = user_id
-        self.restaurant_id = restaurant_id
+        self.id = sys.intern(id)
+        self.user_id = sys.intern(user_id)
+        self.restaurant_id = sys.intern(restaurant_id)
         self.delivery_address = delivery_address
         self.items: List[OrderItem] = []
         self.status = OrderStatus.PENDING
-        self.total_amount = 0.0
+        self.total_cents = 0
+
+    @property
+    def total_amount(self) -> float:
+        """Total cost of the order in currency units."""
+        return self.total_cents / 100
 
     def add_item(self, dish_id: str, quantity: int, price: float) -> None:
-        self.items.append(OrderItem(dish_id, quantity, price))
-        self.total_amount += price * quantity
+        price_cents = to_cents(price)
+        self.items.append(OrderItem(dish_id, quantity, price_cents))
+        self.total_cents += price_cents * quantity
 
     def update_status(self, status: OrderStatus) -> None:
         self.status = status
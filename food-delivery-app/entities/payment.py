@@ -1,11 +1,12 @@
 """
 Payment entity for the food delivery app.
 """
+import sys
 from typing import Optional
 from enum import Enum
 
 
-class PaymentStatus(Enum):
+class PaymentStatus(str, Enum):
     PENDING = "pending"
     PROCESSING = "processing"
     SUCCESSFUL = "successful"
@@ -13,7 +14,7 @@ class PaymentStatus(Enum):
     REFUNDED = "refunded"
 
 
-class PaymentMethod(Enum):
+class PaymentMethod(str, Enum):
     CREDIT_CARD = "credit_card"
     DEBIT_CARD = "debit_card"
     DIGITAL_WALLET = "digital_wallet"
@@ -28,14 +29,16 @@ class Payment:
     # status: current state of the payment
     # transaction_id: external payment gateway transaction reference
     # user_id: user making the payment
+    __slots__ = ("id", "order_id", "amount", "payment_method", "status", "transaction_id", "user_id")
+
     def __init__(self, id: str, order_id: str, amount: float, payment_method: PaymentMethod, user_id: str):
-        self.id = id
-        self.order_id = order_id
+        self.id = sys.intern(id)
+        self.order_id = sys.intern(order_id)
         self.amount = amount
         self.payment_method = payment_method
         self.status = PaymentStatus.PENDING
         self.transaction_id: Optional[str] = None
-        self.user_id = user_id
+        self.user_id = sys.intern(user_id)
 
     def update_status(self, status: PaymentStatus, transaction_id: Optional[str] = None) -> None:
         self.status = status
@@ -1,6 +1,7 @@
 """
 Restaurant entity for the food delivery app.
 """
+import sys
 from typing import Optional
 
 
@@ -10,10 +11,12 @@ class Restaurant:
     # cuisine: type of cuisine for filtering and categorization
     # address: location for delivery coordination
     # is_active: prevents ordering when False
+    __slots__ = ("id", "name", "cuisine", "address", "is_active")
+
     def __init__(self, id: str, name: str, cuisine: str, address: str, is_active: bool = True):
-        self.id = id
+        self.id = sys.intern(id)
         self.name = name
-        self.cuisine = cuisine
+        self.cuisine = sys.intern(cuisine)
         self.address = address
         self.is_active = is_active
 
@@ -1,6 +1,7 @@
 """
 User entity for the food delivery app.
 """
+import sys
 from typing import Optional
 from validators import Validators
 from errors import ValidationError
@@ -12,6 +13,8 @@ class User:
     # email: contact information and login credential
     # phone: contact information for delivery coordination
     # is_active: prevents ordering when False
+    __slots__ = ("id", "name", "email", "phone", "is_active")
+
     def __init__(self, id: str, name: str, email: str, phone: str, is_active: bool = True):
         # Validate inputs
         Validators.validate_id_format(id, "User")
@@ -19,7 +22,7 @@ class User:
         Validators.validate_email(email)
         Validators.validate_phone(phone)
         
-        self.id = id
+        self.id = sys.intern(id)
         self.name = name
         self.email = email
         self.phone = phone
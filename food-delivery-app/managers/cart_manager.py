@@ -4,6 +4,7 @@ Cart manager for orchestrating cart-related business rules.
 from typing import Optional
 from entities.cart import Cart
 from entities.dish import Dish
+from entities.order import to_cents
 from repositories.base_repository import BaseRepository
 from repositories.in_memory.cart_repo import InMemoryCartRepository
 from errors import EntityNotFoundError, CartError, BusinessRuleViolationError
@@ -38,36 +39,38 @@ class CartManager:
     
     def add_dish_to_cart(self, user_id: str, dish_id: str, quantity: int = 1) -> None:
         """Add a dish to the user's cart with validation."""
+        # Only input and storage failures are wrapped in CartError; business rule
+        # violations below propagate as raised
         try:
             Validators.validate_quantity(quantity)
             
             # Get or create cart for user
             cart = self.get_user_cart_or_create(user_id)
-            
-            # Validate dish exists and is available
             dish = self.dish_repository.get_by_id(dish_id)
-            if not dish:
-                raise EntityNotFoundError(f"Dish not found with ID: {dish_id}")
-            
-            if not dish.is_available:
-                raise BusinessRuleViolationError(f"Dish {dish_id} is not available")
-            
-            # Validate restaurant constraint
-            if cart.restaurant_id and cart.restaurant_id != dish.restaurant_id:
-                raise BusinessRuleViolationError(
-                    f"Cannot add dish from restaurant {dish.restaurant_id} to cart with restaurant {cart.restaurant_id}"
-                )
-            
-            # Set restaurant_id if not set
-            if not cart.restaurant_id:
-                cart.restaurant_id = dish.restaurant_id
-            
-            cart.add_item(dish_id, quantity)
+        except Exception as e:
+            raise CartError(f"Failed to add dish to cart: {str(e)}")
+        
+        # Validate dish exists and is available
+        if not dish:
+            raise EntityNotFoundError(f"Dish not found with ID: {dish_id}")
+        
+        if not dish.is_available:
+            raise BusinessRuleViolationError(f"Dish {dish_id} is not available")
+        
+        # Validate restaurant constraint
+        if cart.restaurant_id and cart.restaurant_id != dish.restaurant_id:
+            raise BusinessRuleViolationError(
+                f"Cannot add dish from restaurant {dish.restaurant_id} to cart with restaurant {cart.restaurant_id}"
+            )
+        
+        # Set restaurant_id if not set
+        if not cart.restaurant_id:
+            cart.restaurant_id = dish.restaurant_id
+        
+        cart.add_item(dish_id, quantity)
+        try:
             self.cart_repository.save(cart)
-            
         except Exception as e:
-            if isinstance(e, (EntityNotFoundError, BusinessRuleViolationError)):
-                raise
             raise CartError(f"Failed to add dish to cart: {str(e)}")
     
     def remove_dish_from_cart(self, user_id: str, dish_id: str) -> None:
@@ -94,10 +97,9 @@ class CartManager:
         if not cart:
             return 0.0
         
-        total = 0.0
-        for item in cart.items:
-            dish = self.dish_repository.get_by_id(item.dish_id)
-            if dish:
-                total += dish.price * item.quantity
-        
-        return total
+        # One bulk lookup for every dish in the cart; dishes no longer on file are skipped
+        items = cart.items
+        dishes = self.dish_repository.get_by_ids(items)
+        total_cents = sum(to_cents(dishes[dish_id].price) * quantity
+                          for dish_id, quantity in items.items() if dish_id in dishes)
+        return total_cents / 100
@@ -1,8 +1,9 @@
 """
 Dish manager for orchestrating dish-related business rules.
 """
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from entities.dish import Dish
+from errors import ValidationError
 from repositories.base_repository import BaseRepository
 from repositories.in_memory.dish_repo import InMemoryDishRepository
 
@@ -15,6 +16,24 @@ class DishManager:
         dish = Dish(id=id, name=name, price=price, restaurant_id=restaurant_id, description=description)
         return self.dish_repository.save(dish)
     
+    def bulk_import(self, records: Iterable[Dict[str, Any]]) -> List[Dish]:
+        """Create dishes from records with create_dish's keyword names, all or nothing.
+        Every row is validated first; failures are reported together by row index."""
+        dishes: List[Dish] = []
+        errors: List[str] = []
+        for index, record in enumerate(records):
+            try:
+                dishes.append(Dish(**record))
+            except (ValidationError, TypeError) as e:
+                errors.append(f"row {index}: {e}")
+        if errors:
+            raise ValidationError(f"{len(errors)} invalid dish record(s): " + "; ".join(errors))
+        
+        save = self.dish_repository.save
+        for dish in dishes:
+            save(dish)
+        return dishes
+    
     def get_dish(self, dish_id: str) -> Optional[Dish]:
         return self.dish_repository.get_by_id(dish_id)
     
@@ -45,15 +45,15 @@ class OrderManager:
                          delivery_address=delivery_address)
             
             # Add items from cart to order
-            for cart_item in cart.items:
-                dish = self.dish_repository.get_by_id(cart_item.dish_id)
+            for dish_id, quantity in cart.items.items():
+                dish = self.dish_repository.get_by_id(dish_id)
                 if not dish:
-                    raise EntityNotFoundError(f"Dish not found: {cart_item.dish_id}")
+                    raise EntityNotFoundError(f"Dish not found: {dish_id}")
                 
                 if not dish.is_available:
-                    raise BusinessRuleViolationError(f"Dish {cart_item.dish_id} is not available")
+                    raise BusinessRuleViolationError(f"Dish {dish_id} is not available")
                 
-                order.add_item(cart_item.dish_id, cart_item.quantity, dish.price)
+                order.add_item(dish_id, quantity, dish.price)
             
             if not order.items:
                 raise BusinessRuleViolationError("No valid items found in cart for order")
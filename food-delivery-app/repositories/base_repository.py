@@ -2,7 +2,7 @@
 Base repository interface for the food delivery app.
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic
+from typing import Dict, Iterable, List, Optional, TypeVar, Generic
 
 T = TypeVar('T')
 
@@ -20,6 +20,15 @@ class BaseRepository(ABC, Generic[T]):
         """Get an entity by its ID."""
         pass
     
+    def get_by_ids(self, ids: Iterable[str]) -> Dict[str, T]:
+        """Get several entities by ID in one call. IDs with no entity are left out."""
+        entities = {}
+        for id in ids:
+            entity = self.get_by_id(id)
+            if entity is not None:
+                entities[id] = entity
+        return entities
+    
     @abstractmethod
     def list_all(self) -> List[T]:
         """Get all entities from the repository."""
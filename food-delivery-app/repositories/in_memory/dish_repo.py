@@ -1,7 +1,7 @@
 """
 In-memory dish repository implementation.
 """
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from entities.dish import Dish
 from repositories.base_repository import BaseRepository
 
@@ -17,6 +17,10 @@ class InMemoryDishRepository(BaseRepository[Dish]):
     def get_by_id(self, id: str) -> Optional[Dish]:
         return self._dishes.get(id)
     
+    def get_by_ids(self, ids: Iterable[str]) -> Dict[str, Dish]:
+        dishes = self._dishes
+        return {id: dishes[id] for id in ids if id in dishes}
+    
     def list_all(self) -> List[Dish]:
         return list(self._dishes.values())
     
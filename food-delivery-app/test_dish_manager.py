@@ -0,0 +1,51 @@
+"""
+Unit tests for DishManager bulk import.
+"""
+import unittest
+
+from errors import ValidationError
+from managers.dish_manager import DishManager
+from repositories.in_memory.dish_repo import InMemoryDishRepository
+
+
+class TestDishManagerBulkImport(unittest.TestCase):
+    """Test creating dishes from a batch of records"""
+
+    def setUp(self):
+        self.dish_repository = InMemoryDishRepository()
+        self.dish_manager = DishManager(self.dish_repository)
+
+    def test_bulk_import_saves_every_dish(self):
+        """Test valid records are created and saved in order"""
+        records = [
+            {"id": "dish_1", "name": "Margherita", "price": 12.5, "restaurant_id": "rest_1"},
+            {"id": "dish_2", "name": "Tiramisu", "price": 6.0, "restaurant_id": "rest_1",
+             "description": "Coffee dessert"},
+        ]
+
+        dishes = self.dish_manager.bulk_import(records)
+
+        self.assertEqual([dish.id for dish in dishes], ["dish_1", "dish_2"])
+        self.assertEqual(self.dish_manager.get_dish("dish_2").description, "Coffee dessert")
+        self.assertEqual(len(self.dish_manager.list_dishes_by_restaurant("rest_1")), 2)
+
+    def test_bulk_import_rejects_batch_with_invalid_rows(self):
+        """Test invalid rows are reported by index and nothing is saved"""
+        records = [
+            {"id": "dish_1", "name": "Margherita", "price": 12.5, "restaurant_id": "rest_1"},
+            {"id": "dish_2", "name": "Free Lunch", "price": 0, "restaurant_id": "rest_1"},
+            {"id": "dish_3", "name": "Soup", "price": 4.0, "restaurant_id": "rest_1", "spicy": True},
+        ]
+
+        with self.assertRaises(ValidationError) as context:
+            self.dish_manager.bulk_import(records)
+
+        message = str(context.exception)
+        self.assertIn("2 invalid dish record(s)", message)
+        self.assertIn("row 1: Price must be greater than zero", message)
+        self.assertIn("row 2:", message)
+        self.assertEqual(self.dish_manager.list_all_dishes(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
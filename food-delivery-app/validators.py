@@ -6,6 +6,11 @@ from typing import Optional
 from errors import ValidationError
 
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_ID_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+
 class Validators:
     """Static validation methods for input validation."""
     
@@ -15,8 +20,7 @@ class Validators:
         if not email or not isinstance(email, str):
             raise ValidationError("Email is required and must be a string")
         
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        if not _EMAIL_RE.match(email):
             raise ValidationError(f"Invalid email format: {email}")
     
     @staticmethod
@@ -26,7 +30,7 @@ class Validators:
             raise ValidationError("Phone number is required and must be a string")
         
         # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = _NON_DIGIT_RE.sub('', phone)
         if len(digits_only) < 10:
             raise ValidationError(f"Phone number must have at least 10 digits: {phone}")
     
@@ -57,7 +61,7 @@ class Validators:
     @staticmethod
     def validate_string_not_empty(value: str, field_name: str) -> None:
         """Validate that a string is not empty."""
-        if not value or not isinstance(value, str) or not value.strip():
+        if not value or not isinstance(value, str) or value.isspace():
             raise ValidationError(f"{field_name} is required and cannot be empty")
     
     @staticmethod
@@ -66,7 +70,7 @@ class Validators:
         if not id_value or not isinstance(id_value, str):
             raise ValidationError(f"{entity_name} ID is required and must be a string")
         
-        if not re.match(r'^[a-zA-Z0-9_-]+$', id_value):
+        if not _ID_RE.match(id_value):
             raise ValidationError(f"{entity_name} ID contains invalid characters")
     
     @staticmethod